@@ -13,6 +13,17 @@ class AudioDecoder:
         time.sleep(0.5)
         self._initialized = True
 
+    @property
+    def initialized(self) -> bool:
+        """Whether the audio decoder is ready to decode."""
+        return self._initialized
+
+    def shutdown(self) -> None:
+        """Release the audio decoder."""
+        if self._initialized:
+            print("Shutting down audio decoder...")
+            self._initialized = False
+
     def decode_audio(self, audio_stream: str) -> None:
         """
         Decode the audio stream.
@@ -28,6 +39,26 @@ class AudioDecoder:
         print(f"Decoding audio stream: {audio_stream}")
         time.sleep(1)
 
+    def decode_chunk(self, audio_stream: str, index: int) -> str:
+        """
+        Decode a single chunk of the audio stream.
+
+        Args:
+            audio_stream: The audio stream to decode
+            index: 1-based index of the chunk
+
+        Returns:
+            The decoded audio chunk
+
+        Raises:
+            RuntimeError: If decoder not initialized
+        """
+        if not self._initialized:
+            raise RuntimeError("Audio decoder not initialized")
+        print(f"Decoding audio chunk {index} of {audio_stream}")
+        time.sleep(0.3)
+        return f"audio_{index}"
+
 
 class VideoDecoder:
     """Subsystem class for video decoding operations."""
@@ -41,6 +72,17 @@ class VideoDecoder:
         time.sleep(0.5)
         self._initialized = True
 
+    @property
+    def initialized(self) -> bool:
+        """Whether the video decoder is ready to decode."""
+        return self._initialized
+
+    def shutdown(self) -> None:
+        """Release the video decoder."""
+        if self._initialized:
+            print("Shutting down video decoder...")
+            self._initialized = False
+
     def decode_video(self, video_stream: str) -> None:
         """
         Decode the video stream.
@@ -55,3 +97,23 @@ class VideoDecoder:
             raise RuntimeError("Video decoder not initialized")
         print(f"Decoding video stream: {video_stream}")
         time.sleep(1.5)
+
+    def decode_frame(self, video_stream: str, index: int) -> str:
+        """
+        Decode a single frame of the video stream.
+
+        Args:
+            video_stream: The video stream to decode
+            index: 1-based index of the frame
+
+        Returns:
+            The decoded frame data
+
+        Raises:
+            RuntimeError: If decoder not initialized
+        """
+        if not self._initialized:
+            raise RuntimeError("Video decoder not initialized")
+        print(f"Decoding video frame {index} of {video_stream}")
+        time.sleep(0.5)
+        return f"frame_{index}"
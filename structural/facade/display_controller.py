@@ -1,8 +1,13 @@
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from typing import Optional
 
 from decoders import AudioDecoder, VideoDecoder
 from files import AVIFile, MP4File, VideoFile
+from frame_scheduler import FrameScheduler, FrameStats
+from pipeline import PlaybackPipeline
 
 
 class DisplayController:
@@ -11,6 +16,11 @@ class DisplayController:
     def __init__(self):
         self._active = False
 
+    @property
+    def active(self) -> bool:
+        """Whether the display is ready to render frames."""
+        return self._active
+
     def activate_display(self) -> None:
         """Activate the video display."""
         print("Activating display...")
@@ -43,11 +53,26 @@ class VideoPlayerFacade:
     Facade class that provides a simple interface to the complex video playback system.
     """
 
-    def __init__(self):
+    def __init__(self, idle_timeout: float = 30.0, target_fps: float = 1 / 0.7):
+        """
+        Initialize the facade with cold subsystems.
+
+        Args:
+            idle_timeout: Seconds warm subsystems are kept after stop() or
+                warm_up() before being shut down
+            target_fps: Frame rate the render loop holds during playback
+        """
         self._audio_decoder = AudioDecoder()
         self._video_decoder = VideoDecoder()
         self._display = DisplayController()
         self._current_file: Optional[VideoFile] = None
+        self._idle_timeout = idle_timeout
+        self._idle_timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()
+        self._pipeline: Optional[PlaybackPipeline] = None
+        self._playing = False
+        self._stop_requested = threading.Event()
+        self._frame_scheduler = FrameScheduler(target_fps)
 
     def play(self, filename: str) -> None:
         """
@@ -60,43 +85,220 @@ class VideoPlayerFacade:
             ValueError: For unsupported file formats
             RuntimeError: For playback errors
         """
+        # Determine file type before touching subsystems so that a bad
+        # filename does not tear down decoders kept warm for the next play
+        if filename.lower().endswith(".mp4"):
+            video_file: VideoFile = MP4File(filename)
+        elif filename.lower().endswith(".avi"):
+            video_file = AVIFile(filename)
+        else:
+            raise ValueError(f"Unsupported file format: {filename}")
+
+        self._cancel_idle_timer()
+        with self._lock:
+            self._playing = True
+            self._stop_requested.clear()
         try:
-            # Determine file type and load appropriate handler
-            if filename.lower().endswith(".mp4"):
-                self._current_file = MP4File(filename)
-            elif filename.lower().endswith(".avi"):
-                self._current_file = AVIFile(filename)
+            self._current_file = video_file
+            self._start_subsystems(self._current_file)
+
+            pipeline = PlaybackPipeline(
+                frame_count=3,
+                decode_video=partial(
+                    self._video_decoder.decode_frame, "main_video_stream"
+                ),
+                decode_audio=partial(
+                    self._audio_decoder.decode_chunk, "main_audio_stream"
+                ),
+                present=self._present_frame,
+            )
+            # A stop() that arrived during startup cancels the play here; one
+            # that arrives later cancels the published pipeline
+            with self._lock:
+                cancelled = self._stop_requested.is_set()
+                if not cancelled:
+                    self._pipeline = pipeline
+
+            if not cancelled:
+                print(f"\nPlaying {filename}...")
+                self._frame_scheduler.reset()
+                try:
+                    cancelled = not pipeline.run()
+                finally:
+                    with self._lock:
+                        self._pipeline = None
+                stats = self._frame_scheduler.stats()
+                print(
+                    f"Frames presented: {stats.presented}, "
+                    f"skipped slots: {stats.skipped_slots}, "
+                    f"jitter mean/max: {stats.mean_jitter * 1000:.1f}/"
+                    f"{stats.max_jitter * 1000:.1f} ms"
+                )
+
+            if cancelled:
+                # stop() leaves the file to the running play, which is the
+                # only place that knows its load has finished
+                video_file.unload()
+                print("\nPlayback cancelled")
             else:
-                raise ValueError(f"Unsupported file format: {filename}")
+                print("\nPlayback completed successfully!")
+
+        except Exception as e:
+            with self._lock:
+                self._playing = False
+            print(f"\nPlayback failed: {e}")
+            self.shutdown()
+            raise RuntimeError("Playback aborted due to errors") from e
 
-            # Initialize subsystems
-            self._audio_decoder.initialize()
-            self._video_decoder.initialize()
-            self._display.activate_display()
+        # Idle time starts now whether or not the caller ever calls stop()
+        with self._lock:
+            self._playing = False
+        self._arm_idle_timer()
 
-            # Load and play the file
-            self._current_file.load()
+    def _present_frame(self, frame_data: str, audio_chunk: str) -> None:
+        """
+        Render a decoded frame at its scheduled presentation time.
 
-            print(f"\nPlaying {filename}...")
-            self._video_decoder.decode_video("main_video_stream")
-            self._audio_decoder.decode_audio("main_audio_stream")
+        When a frame arrives late the scheduler skips the missed slots, so
+        playback stays on the target frame rate's time grid.
 
-            # Simulate frame rendering
-            for i in range(1, 4):
-                self._display.render_frame(f"frame_{i}")
-                time.sleep(0.7)
+        Args:
+            frame_data: The decoded frame to render
+            audio_chunk: The audio chunk played alongside the frame
+        """
+        skipped = self._frame_scheduler.wait_for_slot()
+        if skipped:
+            print(f"Behind schedule, skipped {skipped} frame slot(s)")
+        self._display.render_frame(f"{frame_data} + {audio_chunk}")
+
+    @property
+    def frame_stats(self) -> FrameStats:
+        """Frame pacing statistics for the most recent playback."""
+        return self._frame_scheduler.stats()
+
+    def warm_up(self) -> None:
+        """
+        Pre-initialize the decoders and display ahead of the first play.
 
-            print("\nPlayback completed successfully!")
+        The subsystems stay warm until the idle timeout expires without a
+        play() call.
 
+        Raises:
+            RuntimeError: If a subsystem fails to start
+        """
+        self._cancel_idle_timer()
+        try:
+            self._start_subsystems(None)
         except Exception as e:
-            print(f"\nPlayback failed: {e}")
-            self.stop()
-            raise RuntimeError("Playback aborted due to errors") from e
+            self.shutdown()
+            raise RuntimeError("Warm-up failed") from e
+        self._arm_idle_timer()
+
+    def _start_subsystems(self, video_file: Optional[VideoFile]) -> None:
+        """
+        Bring every subsystem that is not ready yet up concurrently.
+
+        Decoders and the display left warm by a previous play are skipped,
+        so back-to-back plays only pay for loading the file. The remaining
+        steps are independent, so startup takes as long as the slowest one
+        instead of their sum. Every step has finished, successfully or not,
+        by the time this returns, so a failure never races with cleanup.
+
+        Args:
+            video_file: File to load alongside the subsystems, if any
+
+        Raises:
+            Exception: The error raised by the first failing step
+        """
+        steps = []
+        if not self._audio_decoder.initialized:
+            steps.append(self._audio_decoder.initialize)
+        if not self._video_decoder.initialized:
+            steps.append(self._video_decoder.initialize)
+        if not self._display.active:
+            steps.append(self._display.activate_display)
+        if video_file is not None:
+            steps.append(video_file.load)
+        if not steps:
+            return
+        with ThreadPoolExecutor(max_workers=len(steps)) as executor:
+            futures = [executor.submit(step) for step in steps]
+        for future in futures:
+            future.result()
+
+    def _arm_idle_timer(self) -> None:
+        """
+        Schedule shutdown of the warm subsystems after the idle timeout.
+
+        Does nothing while play() is running; play() arms the timer itself
+        once playback ends.
+        """
+        with self._lock:
+            if self._playing:
+                return
+            if self._idle_timer is not None:
+                self._idle_timer.cancel()
+            timer = threading.Timer(self._idle_timeout, self._release_idle)
+            timer.daemon = True
+            self._idle_timer = timer
+            timer.start()
+
+    def _cancel_idle_timer(self) -> None:
+        """
+        Keep the warm subsystems alive for an upcoming play.
+
+        Taking the lock waits out a release already in progress, after which
+        the subsystems simply read as not ready and are started again.
+        """
+        with self._lock:
+            if self._idle_timer is not None:
+                self._idle_timer.cancel()
+                self._idle_timer = None
+
+    def _release_idle(self) -> None:
+        """Shut down the subsystems once they have been idle too long."""
+        with self._lock:
+            if threading.current_thread() is not self._idle_timer:
+                return  # Cancelled or superseded by a newer timer
+            self._idle_timer = None
+            print("\nIdle timeout reached, releasing subsystems...")
+            self._shutdown_subsystems()
+
+    def _shutdown_subsystems(self) -> None:
+        """Deactivate the display and shut down both decoders."""
+        self._display.deactivate_display()
+        self._audio_decoder.shutdown()
+        self._video_decoder.shutdown()
 
     def stop(self) -> None:
-        """Stop playback and clean up resources."""
+        """
+        Stop playback and release the current file.
+
+        May be called from another thread while play() is running, including
+        while subsystems are still starting: the play is then cancelled and
+        releases its own file once it winds down. The decoders and display
+        stay warm for the next play() and are shut down once the idle
+        timeout expires.
+        """
         print("\nStopping playback...")
+        with self._lock:
+            self._stop_requested.set()
+            playing = self._playing
+            pipeline = self._pipeline
+        if pipeline is not None:
+            pipeline.cancel()
+        if playing:
+            print("Cancellation requested")
+            return
         if self._current_file:
             self._current_file.unload()
-        self._display.deactivate_display()
+        self._arm_idle_timer()
+        print("File released, subsystems kept warm")
+
+    def shutdown(self) -> None:
+        """Release all subsystems immediately."""
+        self._cancel_idle_timer()
+        if self._current_file:
+            self._current_file.unload()
+        self._shutdown_subsystems()
         print("All resources released")
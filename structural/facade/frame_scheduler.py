@@ -0,0 +1,120 @@
+import math
+import time
+from typing import NamedTuple, Optional
+
+
+class FrameStats(NamedTuple):
+    """Frame pacing statistics for one playback."""
+
+    presented: int
+    skipped_slots: int
+    mean_jitter: float
+    max_jitter: float
+    achieved_fps: float
+
+
+class FrameScheduler:
+    """
+    Paces frame presentation against monotonic-clock deadlines.
+
+    Slot N is due at start + N / target_fps. Deadlines are absolute rather
+    than "sleep one period after the last frame", so time spent rendering
+    never accumulates as drift. When a frame arrives more than max_lateness
+    past its slot, the slots that went by are skipped and the frame is
+    presented at the current (or next) slot instead, so the schedule
+    realigns with the clock rather than running permanently late. Frames
+    that were already decoded are never thrown away.
+    """
+
+    def __init__(self, target_fps: float, max_lateness: Optional[float] = None):
+        """
+        Initialize the scheduler.
+
+        Args:
+            target_fps: Frames per second to hold
+            max_lateness: Seconds a frame may miss its slot before the
+                schedule skips ahead; defaults to half a frame period
+
+        Raises:
+            ValueError: If target_fps is not positive or max_lateness is negative
+        """
+        if target_fps <= 0:
+            raise ValueError("target_fps must be positive")
+        self._period = 1.0 / target_fps
+        self._max_lateness = self._period / 2 if max_lateness is None else max_lateness
+        if self._max_lateness < 0:
+            raise ValueError("max_lateness cannot be negative")
+        self.reset()
+
+    @property
+    def period(self) -> float:
+        """Seconds between consecutive frame deadlines."""
+        return self._period
+
+    def reset(self) -> None:
+        """Forget the schedule and statistics before a new playback."""
+        self._start: Optional[float] = None
+        self._frame = 0
+        self._presented = 0
+        self._skipped = 0
+        self._jitter_total = 0.0
+        self._jitter_max = 0.0
+        self._last_presented = 0.0
+
+    def wait_for_slot(self) -> int:
+        """
+        Wait until the next frame is due.
+
+        The schedule starts at the first call, so decoder warm-up before the
+        first frame does not count as lateness.
+
+        Returns:
+            Number of slots skipped because the frame arrived late
+        """
+        now = time.monotonic()
+        if self._start is None:
+            self._start = now
+        deadline = self._start + self._frame * self._period
+
+        skipped = 0
+        if now - deadline > self._max_lateness:
+            # Realign with the clock: use the current slot, or the next one if
+            # the current slot is itself too far gone
+            slot = math.floor((now - self._start) / self._period)
+            if now - (self._start + slot * self._period) > self._max_lateness:
+                slot += 1
+            skipped = slot - self._frame
+            self._skipped += skipped
+            self._frame = slot
+            deadline = self._start + slot * self._period
+        self._frame += 1
+
+        if deadline > now:
+            time.sleep(deadline - now)
+            now = time.monotonic()
+
+        jitter = abs(now - deadline)
+        self._jitter_total += jitter
+        self._jitter_max = max(self._jitter_max, jitter)
+        self._presented += 1
+        self._last_presented = now
+        return skipped
+
+    def stats(self) -> FrameStats:
+        """
+        Get pacing statistics for the frames scheduled so far.
+
+        Returns:
+            Presented frames and skipped slots, mean and max jitter in seconds and
+            the achieved presentation rate
+        """
+        elapsed = self._last_presented - self._start if self._start is not None else 0
+        return FrameStats(
+            presented=self._presented,
+            skipped_slots=self._skipped,
+            mean_jitter=(
+                self._jitter_total / self._presented if self._presented else 0.0
+            ),
+            max_jitter=self._jitter_max,
+            achieved_fps=(self._presented - 1) / elapsed if elapsed > 0 else 0.0,
+        )
@@ -4,13 +4,16 @@ from display_controller import VideoPlayerFacade
 def demonstrate_facade():
     """Demonstrate the Facade pattern with video playback."""
     try:
-        player = VideoPlayerFacade()
+        player = VideoPlayerFacade(idle_timeout=5.0)
 
-        print("=== Playing MP4 File ===")
+        print("=== Warming Up Subsystems ===")
+        player.warm_up()
+
+        print("\n=== Playing MP4 File ===")
         player.play("sample_video.mp4")
         player.stop()
 
-        print("\n=== Playing AVI File ===")
+        print("\n=== Playing AVI File (subsystems still warm) ===")
         player.play("another_video.avi")
         player.stop()
 
@@ -27,6 +30,8 @@ def demonstrate_facade():
         except RuntimeError as e:
             print(f"Expected error: {e}")
 
+        player.shutdown()
+
     except Exception as e:
         print(f"An unexpected error occurred: {e}")
 
@@ -0,0 +1,148 @@
+import queue
+import threading
+from typing import Callable, List, Optional
+
+_END_OF_STREAM = object()
+
+
+class PlaybackPipeline:
+    """
+    Producer/consumer pipeline that overlaps decoding with rendering.
+
+    Video decode and audio decode each run on their own thread and feed a
+    bounded queue; the presentation stage pairs frames with audio chunks in
+    the calling thread. A full queue blocks its producer (backpressure), so
+    frame N+1 is decoded while frame N is rendered and throughput is limited
+    by the slowest stage instead of the sum of all stages.
+    """
+
+    _POLL_INTERVAL = 0.1
+
+    def __init__(
+        self,
+        frame_count: int,
+        decode_video: Callable[[int], str],
+        decode_audio: Callable[[int], str],
+        present: Callable[[str, str], None],
+        queue_size: int = 2,
+    ):
+        """
+        Initialize the pipeline.
+
+        Args:
+            frame_count: Number of frames to decode and present
+            decode_video: Decodes the frame with the given 1-based index
+            decode_audio: Decodes the audio chunk with the given 1-based index
+            present: Renders a frame together with its audio chunk
+            queue_size: Maximum number of decoded items buffered per stream
+
+        Raises:
+            ValueError: If frame_count or queue_size is not positive
+        """
+        if frame_count < 1 or queue_size < 1:
+            raise ValueError("frame_count and queue_size must be positive")
+        self._frame_count = frame_count
+        self._decode_video = decode_video
+        self._decode_audio = decode_audio
+        self._present = present
+        self._video_frames: "queue.Queue[object]" = queue.Queue(maxsize=queue_size)
+        self._audio_chunks: "queue.Queue[object]" = queue.Queue(maxsize=queue_size)
+        self._cancelled = threading.Event()
+        self._error: Optional[BaseException] = None
+        self._error_lock = threading.Lock()
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether the pipeline was cancelled or aborted by a stage error."""
+        return self._cancelled.is_set()
+
+    def cancel(self) -> None:
+        """Stop every stage at its next item; safe to call from any thread."""
+        self._cancelled.set()
+
+    def run(self) -> bool:
+        """
+        Run all stages until the stream ends or the pipeline is cancelled.
+
+        Returns:
+            True if every frame was presented, False if cancelled
+
+        Raises:
+            Exception: The first error raised by any stage
+        """
+        producers: List[threading.Thread] = [
+            threading.Thread(
+                target=self._produce,
+                args=(self._decode_video, self._video_frames),
+                name="video-decode",
+                daemon=True,
+            ),
+            threading.Thread(
+                target=self._produce,
+                args=(self._decode_audio, self._audio_chunks),
+                name="audio-decode",
+                daemon=True,
+            ),
+        ]
+        for producer in producers:
+            producer.start()
+        try:
+            self._consume()
+        except BaseException as e:
+            self._fail(e)
+        finally:
+            for producer in producers:
+                producer.join()
+
+        if self._error is not None:
+            raise self._error
+        return not self._cancelled.is_set()
+
+    def _produce(
+        self, decode: Callable[[int], str], out: "queue.Queue[object]"
+    ) -> None:
+        """Decode items in order into a queue, followed by an end marker."""
+        try:
+            for index in range(1, self._frame_count + 1):
+                if self._cancelled.is_set():
+                    return
+                if not self._put(out, decode(index)):
+                    return
+            self._put(out, _END_OF_STREAM)
+        except BaseException as e:
+            self._fail(e)
+
+    def _consume(self) -> None:
+        """Present decoded frames with their audio chunks as they arrive."""
+        while True:
+            frame = self._get(self._video_frames)
+            audio = self._get(self._audio_chunks)
+            if frame is None or audio is None or frame is _END_OF_STREAM:
+                return
+            self._present(frame, audio)
+
+    def _put(self, out: "queue.Queue[object]", item: object) -> bool:
+        """Block until the item is queued; returns False if cancelled first."""
+        while not self._cancelled.is_set():
+            try:
+                out.put(item, timeout=self._POLL_INTERVAL)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _get(self, source: "queue.Queue[object]") -> Optional[object]:
+        """Block until an item arrives; returns None if cancelled first."""
+        while not self._cancelled.is_set():
+            try:
+                return source.get(timeout=self._POLL_INTERVAL)
+            except queue.Empty:
+                continue
+        return None
+
+    def _fail(self, error: BaseException) -> None:
+        """Record the first stage error and cancel the remaining stages."""
+        with self._error_lock:
+            if self._error is None:
+                self._error = error
+        self._cancelled.set()
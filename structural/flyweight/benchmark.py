@@ -0,0 +1,160 @@
+import sys
+import threading
+import time
+from typing import List, Tuple
+
+from main import (
+    COLORS,
+    FONTS,
+    Character,
+    CharacterFactory,
+    CharacterProperties,
+    CompactDocument,
+    ConcreteCharacter,
+    Document,
+    TextStyle,
+    traced_allocation,
+)
+
+CHARS = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789"
+
+
+def _style_keys(count: int) -> List[Tuple[str, str, int, str]]:
+    """Build a deterministic list of distinct (char, font, size, color) keys."""
+    keys = []
+    for i in range(count):
+        keys.append(
+            (
+                CHARS[i % len(CHARS)],
+                FONTS[(i // len(CHARS)) % len(FONTS)],
+                10 + (i // (len(CHARS) * len(FONTS))) % 15,
+                COLORS[i % len(COLORS)],
+            )
+        )
+    return keys
+
+
+def benchmark_factory_threads(
+    thread_counts: Tuple[int, ...] = (1, 2, 4, 8),
+    lookups_per_thread: int = 200_000,
+    distinct_styles: int = 1_000,
+) -> None:
+    """
+    Measure CharacterFactory lookup throughput as the number of threads grows.
+
+    Every thread looks up the same set of styles, so the run also checks
+    that concurrent builders never end up with duplicate flyweights.
+
+    Args:
+        thread_counts: Thread counts to measure
+        lookups_per_thread: Number of get_character calls made by each thread
+        distinct_styles: Number of distinct flyweights in the working set
+    """
+    keys = _style_keys(distinct_styles)
+    gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(
+        f"\n=== CharacterFactory thread scaling "
+        f"(GIL {'enabled' if gil_enabled else 'disabled'}) ==="
+    )
+    print(f"{'threads':>8} {'lookups/s':>14} {'speedup':>8} {'duplicates':>11}")
+
+    baseline = None
+    for threads in thread_counts:
+        CharacterFactory.configure()
+        results: List[List[CharacterProperties]] = [[] for _ in range(threads)]
+        barrier = threading.Barrier(threads + 1)
+
+        def worker(slot: int) -> None:
+            get_character = CharacterFactory.get_character
+            seen = results[slot]
+            barrier.wait()
+            for i in range(lookups_per_thread):
+                flyweight = get_character(*keys[(i + slot) % distinct_styles])
+                if i < distinct_styles:
+                    seen.append(flyweight)
+
+        workers = [threading.Thread(target=worker, args=(n,)) for n in range(threads)]
+        for thread in workers:
+            thread.start()
+        barrier.wait()
+        start = time.perf_counter()
+        for thread in workers:
+            thread.join()
+        elapsed = time.perf_counter() - start
+
+        distinct = {id(flyweight) for seen in results for flyweight in seen}
+        duplicates = len(distinct) - distinct_styles
+        throughput = threads * lookups_per_thread / elapsed
+        baseline = baseline or throughput
+        print(
+            f"{threads:>8} {throughput:>14,.0f} {throughput / baseline:>7.2f}x "
+            f"{duplicates:>11}"
+        )
+
+    CharacterFactory.configure()
+
+
+def _glyph_stream(
+    size: int, styles: List[Tuple[str, str, int, str]]
+) -> List[Tuple[str, Tuple[int, int], TextStyle]]:
+    """Build `size` positioned characters cycling through the given styles."""
+    glyphs = []
+    for i in range(size):
+        char, font, point_size, color = styles[i % len(styles)]
+        glyphs.append((char, (i % 1000, i // 1000), TextStyle(font, point_size, color)))
+    return glyphs
+
+
+def benchmark_memory(
+    sizes: Tuple[int, ...] = (1_000, 10_000, 100_000),
+    style_counts: Tuple[int, ...] = (10, 100, 1_000),
+) -> None:
+    """
+    Measure real bytes per glyph for each document layout.
+
+    Compares Document and CompactDocument against an unshared baseline in
+    which every character owns its intrinsic state. Bytes are net
+    allocations traced with tracemalloc, including the flyweight pool.
+
+    Args:
+        sizes: Document sizes (number of glyphs) to sweep
+        style_counts: Numbers of distinct (char, font, size, color) styles to sweep
+    """
+    print("\n=== Memory per glyph (tracemalloc) ===")
+    print(
+        f"{'glyphs':>8} {'styles':>7} {'unshared':>10} {'document':>10} "
+        f"{'compact':>9} {'saved':>7}"
+    )
+
+    for size in sizes:
+        for style_count in style_counts:
+            glyphs = _glyph_stream(size, _style_keys(style_count))
+
+            def build_unshared() -> List[Character]:
+                return [
+                    Character.from_flyweight(ConcreteCharacter(char, *style), position)
+                    for char, position, style in glyphs
+                ]
+
+            def build(document_class: type) -> Document:
+                document = document_class()
+                document.add_characters(glyphs)
+                return document
+
+            _, unshared = traced_allocation(build_unshared)
+            CharacterFactory.configure()
+            _, document = traced_allocation(lambda: build(Document))
+            CharacterFactory.configure()
+            _, compact = traced_allocation(lambda: build(CompactDocument))
+            CharacterFactory.configure()
+
+            print(
+                f"{size:>8} {style_count:>7} {unshared / size:>10.1f} "
+                f"{document / size:>10.1f} {compact / size:>9.1f} "
+                f"{1 - compact / unshared:>6.1%}"
+            )
+
+
+if __name__ == "__main__":
+    benchmark_factory_threads()
+    benchmark_memory()
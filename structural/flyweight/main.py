@@ -1,11 +1,64 @@
+import mmap
+import os
 import random
+import struct
+import sys
+import tempfile
+import threading
+import tracemalloc
+import weakref
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Tuple
+from array import array
+from bisect import bisect_right
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from multiprocessing import shared_memory
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    TextIO,
+    Tuple,
+    TypeVar,
+)
+
+FONTS = ("Arial", "Times New Roman", "Courier New", "Verdana")
+COLORS = ("black", "red", "blue", "green", "purple")
+
+FlyweightKey = Tuple[str, str, int, str]
+
+# Binary document format: header, flyweight table, then the position and
+# flyweight-index columns as little-endian arrays aligned to four bytes.
+_FILE_MAGIC = b"FLYW"
+_FILE_VERSION = 1
+_FILE_HEADER = struct.Struct("<4sHHQI")
+_FILE_STRING = struct.Struct("<H")
+_FILE_SIZE = struct.Struct("<i")
+
+
+class TextStyle(NamedTuple):
+    """Font, size and color shared by a run of characters."""
+
+    font: str = "Arial"
+    size: int = 12
+    color: str = "black"
 
 
 class CharacterProperties(ABC):
     """Flyweight interface that declares properties of characters."""
 
+    @property
+    @abstractmethod
+    def key(self) -> "FlyweightKey":
+        """Get the (char, font, size, color) intrinsic state of the flyweight."""
+        pass
+
     @abstractmethod
     def render(self, position: Tuple[int, int]) -> str:
         """
@@ -45,23 +98,87 @@ class ConcreteCharacter(CharacterProperties):
         self._font = font
         self._size = size
         self._color = color
+        # Precomputed once so rendering only formats the position
+        self._prefix = f"Character '{char}' rendered at ("
+        self._suffix = f") with font '{font}', size {size}, color {color}"
+
+    @property
+    def key(self) -> "FlyweightKey":
+        return (self._char, self._font, self._size, self._color)
 
     def render(self, position: Tuple[int, int]) -> str:
         """Render the character with its shared properties at given position."""
         x, y = position
-        return (
-            f"Character '{self._char}' rendered at ({x}, {y}) "
-            f"with font '{self._font}', size {self._size}, color {self._color}"
-        )
+        return f"{self._prefix}{x}, {y}{self._suffix}"
+
+
+class _ThreadState:
+    """Per-thread front cache and hit counter used by CharacterFactory."""
+
+    __slots__ = ("cache", "generation", "hits", "__weakref__")
+
+    def __init__(self, generation: int):
+        self.cache: Dict[FlyweightKey, CharacterProperties] = {}
+        self.generation = generation
+        self.hits = [0]
 
 
 class CharacterFactory:
     """
     Flyweight factory that manages and reuses existing flyweights.
     Ensures that characters are shared properly.
+
+    The pool is keyed on a (char, font, size, color) tuple. By default it
+    grows without bound; use configure() to cap it with LRU eviction or to
+    hold flyweights weakly so they are dropped once no document uses them.
+
+    The factory is safe to use from several threads. In the default
+    unbounded mode each thread answers repeat lookups from its own front
+    cache without touching shared state; misses go to the shared pool,
+    where creation is serialized per key by a striped lock so no two
+    threads ever build the same flyweight.
     """
 
-    _characters: Dict[str, CharacterProperties] = {}
+    _STRIPES = 16
+
+    _characters: "OrderedDict[FlyweightKey, CharacterProperties]" = OrderedDict()
+    _weak_characters: Dict[FlyweightKey, "weakref.ref[CharacterProperties]"] = {}
+    _max_size: Optional[int] = None
+    _weak: bool = False
+    _misses: int = 0
+    _evictions: int = 0
+    _retired_hits: int = 0
+
+    _stripe_locks = tuple(threading.Lock() for _ in range(_STRIPES))
+    _pool_lock = threading.RLock()
+    _local = threading.local()
+    _thread_hits: List[List[int]] = []
+    _generation: int = 0
+
+    @classmethod
+    def configure(cls, max_size: Optional[int] = None, weak: bool = False) -> None:
+        """
+        Set the pool policy. Clears the pool and resets the counters.
+
+        Thread front caches are only used in the default unbounded mode,
+        since they would otherwise keep evicted flyweights alive.
+
+        Args:
+            max_size: Maximum number of pooled flyweights (None for unbounded)
+            weak: Hold flyweights by weak reference instead of a size cap
+
+        Raises:
+            ValueError: For a non-positive max_size or when combined with weak
+        """
+        if max_size is not None and max_size <= 0:
+            raise ValueError("Pool size must be positive")
+        if max_size is not None and weak:
+            raise ValueError("A size cap cannot be combined with weak references")
+
+        with cls._pool_lock:
+            cls.clear()
+            cls._max_size = max_size
+            cls._weak = weak
 
     @classmethod
     def get_character(
@@ -82,21 +199,140 @@ class CharacterFactory:
         Raises:
             ValueError: For invalid character properties
         """
-        key = f"{char}_{font}_{size}_{color}"
+        key = (char, font, size, color)
+        state = cls._thread_state()
+        use_front_cache = cls._max_size is None and not cls._weak
 
-        if key not in cls._characters:
-            cls._characters[key] = ConcreteCharacter(char, font, size, color)
-            print(f"Created new character flyweight for '{key}'")
-        else:
-            print(f"Reusing existing character flyweight for '{key}'")
+        if use_front_cache:
+            flyweight = state.cache.get(key)
+            if flyweight is not None:
+                state.hits[0] += 1
+                return flyweight
+
+        flyweight = cls._lookup(key)
+        if flyweight is None:
+            with cls._stripe_locks[hash(key) % cls._STRIPES]:
+                flyweight = cls._lookup(key)
+                if flyweight is None:
+                    # Validate before touching the pool so bad input leaves no trace
+                    flyweight = ConcreteCharacter(char, font, size, color)
+                    cls._store(key, flyweight)
+                    if use_front_cache:
+                        state.cache[key] = flyweight
+                    return flyweight
+
+        state.hits[0] += 1
+        if use_front_cache:
+            state.cache[key] = flyweight
+        return flyweight
+
+    @classmethod
+    def _thread_state(cls) -> _ThreadState:
+        """Get the calling thread's front cache, resetting it after a clear()."""
+        state: Optional[_ThreadState] = getattr(cls._local, "state", None)
+        if state is None:
+            state = _ThreadState(cls._generation)
+            cls._local.state = state
+            with cls._pool_lock:
+                cls._thread_hits.append(state.hits)
+            # Fold the counter into the shared total once the thread is gone
+            weakref.finalize(state, cls._retire_hits, state.hits)
+        elif state.generation != cls._generation:
+            state.cache.clear()
+            state.generation = cls._generation
+        return state
+
+    @classmethod
+    def _retire_hits(cls, hits: List[int]) -> None:
+        """Move a finished thread's hit count into the retired total."""
+        with cls._pool_lock:
+            cls._retired_hits += hits[0]
+            # Counters of different threads may compare equal, so match by identity
+            for index, counter in enumerate(cls._thread_hits):
+                if counter is hits:
+                    del cls._thread_hits[index]
+                    break
+
+    @classmethod
+    def _lookup(cls, key: FlyweightKey) -> Optional[CharacterProperties]:
+        """Find a flyweight in the shared pool, refreshing its LRU position."""
+        if cls._weak:
+            ref = cls._weak_characters.get(key)
+            return ref() if ref is not None else None
+
+        flyweight = cls._characters.get(key)
+        if flyweight is not None and cls._max_size is not None:
+            try:
+                cls._characters.move_to_end(key)
+            except KeyError:
+                pass  # Evicted by another thread in the meantime
+        return flyweight
+
+    @classmethod
+    def _store(cls, key: FlyweightKey, flyweight: CharacterProperties) -> None:
+        """Insert a new flyweight into the shared pool, evicting if over the cap."""
+        with cls._pool_lock:
+            cls._misses += 1
+            if cls._weak:
+                cls._weak_characters[key] = weakref.ref(
+                    flyweight, lambda ref, key=key: cls._discard(key, ref)
+                )
+                return
+
+            cls._characters[key] = flyweight
+            if cls._max_size is not None and len(cls._characters) > cls._max_size:
+                cls._characters.popitem(last=False)
+                cls._evictions += 1
 
-        return cls._characters[key]
+    @classmethod
+    def _discard(cls, key: FlyweightKey, ref: "weakref.ref[CharacterProperties]") -> None:
+        """Drop a weakly held flyweight once it has been garbage collected."""
+        with cls._pool_lock:
+            if cls._weak_characters.get(key) is ref:
+                del cls._weak_characters[key]
+                cls._evictions += 1
 
     @classmethod
     def total_flyweights(cls) -> int:
-        """Get the total number of flyweights created."""
+        """Get the number of flyweights currently in the pool."""
+        if cls._weak:
+            return len(cls._weak_characters)
         return len(cls._characters)
 
+    @classmethod
+    def stats(cls) -> Dict[str, int]:
+        """
+        Get the pool counters.
+
+        Returns:
+            Dictionary with hits, misses, evictions and current pool size
+        """
+        with cls._pool_lock:
+            hits = cls._retired_hits + sum(hits[0] for hits in cls._thread_hits)
+            return {
+                "hits": hits,
+                "misses": cls._misses,
+                "evictions": cls._evictions,
+                "size": cls.total_flyweights(),
+            }
+
+    @classmethod
+    def reset_stats(cls) -> None:
+        """Reset the hit/miss/eviction counters without touching the pool."""
+        with cls._pool_lock:
+            for hits in cls._thread_hits:
+                hits[0] = 0
+            cls._retired_hits = cls._misses = cls._evictions = 0
+
+    @classmethod
+    def clear(cls) -> None:
+        """Empty the pool, invalidate thread front caches and reset the counters."""
+        with cls._pool_lock:
+            cls._generation += 1
+            cls._characters.clear()
+            cls._weak_characters.clear()
+            cls.reset_stats()
+
 
 class Character:
     """
@@ -104,6 +340,8 @@ class Character:
     Represents a character in the document with its position.
     """
 
+    __slots__ = ("_position", "_properties")
+
     def __init__(
         self,
         char: str,
@@ -125,11 +363,212 @@ class Character:
         self._position = position
         self._properties = CharacterFactory.get_character(char, font, size, color)
 
+    @classmethod
+    def from_flyweight(
+        cls, properties: CharacterProperties, position: Tuple[int, int]
+    ) -> "Character":
+        """
+        Create a character around an already resolved flyweight.
+
+        Args:
+            properties: The shared character flyweight
+            position: (x, y) coordinates where to render
+
+        Returns:
+            A character referencing the given flyweight
+        """
+        character = cls.__new__(cls)
+        character._position = position
+        character._properties = properties
+        return character
+
+    @property
+    def position(self) -> Tuple[int, int]:
+        return self._position
+
+    @property
+    def properties(self) -> CharacterProperties:
+        return self._properties
+
     def render(self) -> str:
         """Render the character by delegating to the flyweight."""
         return self._properties.render(self._position)
 
 
+T = TypeVar("T")
+
+
+def deep_getsizeof(obj: object, seen: Optional[Set[int]] = None) -> int:
+    """
+    Estimate the bytes held by an object graph with sys.getsizeof.
+
+    Follows containers, instance dictionaries and slots. Objects whose id is
+    already in `seen` are skipped, which lets callers exclude shared state.
+
+    Args:
+        obj: Root of the object graph
+        seen: Ids of objects that must not be counted (updated in place)
+
+    Returns:
+        Total size in bytes of every object reached from obj
+    """
+    seen = set() if seen is None else seen
+    total = 0
+    stack = [obj]
+    while stack:
+        current = stack.pop()
+        if id(current) in seen or isinstance(current, type):
+            continue
+        if type(current) is int and -5 <= current <= 256:
+            continue  # Small ints are interpreter-wide singletons
+        seen.add(id(current))
+        total += sys.getsizeof(current)
+
+        if isinstance(current, dict):
+            stack.extend(current.keys())
+            stack.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset)):
+            stack.extend(current)
+        if hasattr(current, "__dict__"):
+            stack.append(vars(current))
+        for slot in getattr(type(current), "__slots__", ()):
+            if hasattr(current, slot):
+                stack.append(getattr(current, slot))
+    return total
+
+
+def traced_allocation(build: Callable[[], T]) -> Tuple[T, int]:
+    """
+    Measure the bytes still allocated by a builder once it returns.
+
+    Args:
+        build: Callable that constructs and returns the object to measure
+
+    Returns:
+        The built object and the net bytes allocated while building it
+    """
+    already_tracing = tracemalloc.is_tracing()
+    if not already_tracing:
+        tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = build()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        if not already_tracing:
+            tracemalloc.stop()
+    return result, after - before
+
+
+Rect = Tuple[int, int, int, int]
+
+
+class GridIndex:
+    """
+    Uniform grid over glyph positions used for viewport queries.
+
+    Each cell holds the indices of the glyphs positioned inside it, in
+    insertion (document) order. Rectangles are (x0, y0, x1, y1) with the
+    lower bounds inclusive and the upper bounds exclusive.
+    """
+
+    def __init__(self, cell_size: int = 64):
+        """
+        Initialize an empty grid.
+
+        Args:
+            cell_size: Width and height of a grid cell in document units
+
+        Raises:
+            ValueError: If cell_size is not positive
+        """
+        if cell_size <= 0:
+            raise ValueError("Cell size must be positive")
+        self._cell_size = cell_size
+        self._cells: Dict[Tuple[int, int], "array[int]"] = {}
+        self._min_cell: Optional[Tuple[int, int]] = None
+        self._max_cell: Optional[Tuple[int, int]] = None
+
+    @property
+    def cell_size(self) -> int:
+        return self._cell_size
+
+    def insert(self, index: int, position: Tuple[int, int]) -> None:
+        """
+        Register a glyph in the cell that contains its position.
+
+        Args:
+            index: Position of the glyph in the document
+            position: (x, y) coordinates of the glyph
+        """
+        cell = (position[0] // self._cell_size, position[1] // self._cell_size)
+        bucket = self._cells.get(cell)
+        if bucket is None:
+            bucket = self._cells[cell] = array("I")
+            if self._min_cell is None or self._max_cell is None:
+                self._min_cell = self._max_cell = cell
+            else:
+                self._min_cell = (
+                    min(self._min_cell[0], cell[0]),
+                    min(self._min_cell[1], cell[1]),
+                )
+                self._max_cell = (
+                    max(self._max_cell[0], cell[0]),
+                    max(self._max_cell[1], cell[1]),
+                )
+        bucket.append(index)
+
+    def track(
+        self, glyphs: Iterable[Tuple[CharacterProperties, Tuple[int, int]]], start: int
+    ) -> Iterator[Tuple[CharacterProperties, Tuple[int, int]]]:
+        """
+        Pass glyphs through unchanged while indexing them.
+
+        Args:
+            glyphs: (flyweight, position) pairs about to be stored
+            start: Document index of the first glyph
+
+        Yields:
+            The same (flyweight, position) pairs
+        """
+        insert = self.insert
+        for index, glyph in enumerate(glyphs, start):
+            insert(index, glyph[1])
+            yield glyph
+
+    def candidates(self, rect: Rect) -> List[int]:
+        """
+        Get the indices of glyphs in every cell overlapping a rectangle.
+
+        Args:
+            rect: (x0, y0, x1, y1) query rectangle
+
+        Returns:
+            Sorted glyph indices; callers still filter by exact position
+        """
+        if self._min_cell is None or self._max_cell is None:
+            return []
+
+        x0, y0, x1, y1 = rect
+        if x1 <= x0 or y1 <= y0:
+            return []
+        size = self._cell_size
+        cx0 = max(x0 // size, self._min_cell[0])
+        cy0 = max(y0 // size, self._min_cell[1])
+        cx1 = min((x1 - 1) // size, self._max_cell[0])
+        cy1 = min((y1 - 1) // size, self._max_cell[1])
+
+        found: List[int] = []
+        cells = self._cells
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is not None:
+                    found.extend(bucket)
+        found.sort()
+        return found
+
+
 class Document:
     """
     Client class that uses flyweights through Character objects.
@@ -138,6 +577,7 @@ class Document:
 
     def __init__(self):
         self._characters: List[Character] = []
+        self._spatial_index: Optional[GridIndex] = None
 
     def add_character(
         self,
@@ -163,26 +603,790 @@ class Document:
         if len(char) != 1:
             raise ValueError("Can only add single characters")
 
-        fonts = ["Arial", "Times New Roman", "Courier New", "Verdana"]
-        colors = ["black", "red", "blue", "green", "purple"]
-
-        font = font or random.choice(fonts)
+        font = font or random.choice(FONTS)
         size = size or random.randint(10, 24)
-        color = color or random.choice(colors)
+        color = color or random.choice(COLORS)
+
+        self._append(CharacterFactory.get_character(char, font, size, color), position)
+        if self._spatial_index is not None:
+            self._spatial_index.insert(len(self) - 1, position)
+
+    def add_text(
+        self,
+        text: str,
+        origin: Tuple[int, int] = (0, 0),
+        style: TextStyle = TextStyle(),
+        advance: Optional[int] = None,
+        line_height: Optional[int] = None,
+    ) -> None:
+        """
+        Lay out a string left to right and add all of its characters.
+
+        Each distinct character is resolved to a flyweight once per call.
+        A newline moves back to the origin x on the next line and is not
+        stored as a glyph.
+
+        Args:
+            text: The text to add
+            origin: (x, y) coordinates of the first character
+            style: Style applied to every character
+            advance: Horizontal distance between characters (default: font size)
+            line_height: Vertical distance between lines (default: 1.5 x font size)
+
+        Raises:
+            ValueError: For invalid style properties
+        """
+        font, size, color = style
+        advance = size if advance is None else advance
+        line_height = int(size * 1.5) if line_height is None else line_height
+        get_character = CharacterFactory.get_character
+        flyweights: Dict[str, CharacterProperties] = {}
+
+        def layout() -> Iterator[Tuple[CharacterProperties, Tuple[int, int]]]:
+            x, y = origin
+            for char in text:
+                if char == "\n":
+                    x = origin[0]
+                    y += line_height
+                    continue
+                properties = flyweights.get(char)
+                if properties is None:
+                    properties = flyweights[char] = get_character(char, font, size, color)
+                yield properties, (x, y)
+                x += advance
+
+        self._add_glyphs(layout())
+
+    def add_characters(
+        self, characters: Iterable[Tuple[str, Tuple[int, int], TextStyle]]
+    ) -> None:
+        """
+        Add a stream of positioned characters in one pass.
+
+        Each distinct (char, style) pair is resolved to a flyweight once per
+        call. Characters consumed before an invalid entry stay in the document.
+
+        Args:
+            characters: Iterable of (char, (x, y), style) entries
+
+        Raises:
+            ValueError: For invalid characters or style properties
+        """
+        get_character = CharacterFactory.get_character
+        flyweights: Dict[Tuple[str, TextStyle], CharacterProperties] = {}
+
+        def resolve() -> Iterator[Tuple[CharacterProperties, Tuple[int, int]]]:
+            for char, position, style in characters:
+                properties = flyweights.get((char, style))
+                if properties is None:
+                    if len(char) != 1:
+                        raise ValueError("Can only add single characters")
+                    properties = flyweights[(char, style)] = get_character(char, *style)
+                yield properties, position
+
+        self._add_glyphs(resolve())
+
+    def enable_spatial_index(self, cell_size: int = 64) -> None:
+        """
+        Build a grid index over the current glyphs and keep it up to date.
+
+        Args:
+            cell_size: Width and height of a grid cell in document units
+
+        Raises:
+            ValueError: If cell_size is not positive
+        """
+        index = GridIndex(cell_size)
+        for i, (_, position) in enumerate(self._iter_glyphs()):
+            index.insert(i, position)
+        self._spatial_index = index
+
+    def query(self, rect: Rect) -> List[Tuple[CharacterProperties, Tuple[int, int]]]:
+        """
+        Get the glyphs positioned inside a rectangle, in document order.
+
+        Uses the spatial index when enabled and scans every glyph otherwise.
+
+        Args:
+            rect: (x0, y0, x1, y1) with inclusive lower and exclusive upper bounds
+
+        Returns:
+            List of (flyweight, position) pairs inside the rectangle
+        """
+        x0, y0, x1, y1 = rect
+        if self._spatial_index is None:
+            glyphs: Iterable[Tuple[CharacterProperties, Tuple[int, int]]] = (
+                self._iter_glyphs()
+            )
+        else:
+            glyphs = map(self._glyph, self._spatial_index.candidates(rect))
+        return [
+            (properties, position)
+            for properties, position in glyphs
+            if x0 <= position[0] < x1 and y0 <= position[1] < y1
+        ]
 
-        self._characters.append(Character(char, position, font, size, color))
+    def render_viewport(self, rect: Rect, fp: Optional[TextIO] = None) -> int:
+        """
+        Render only the glyphs inside a rectangle.
+
+        Args:
+            rect: (x0, y0, x1, y1) viewport rectangle
+            fp: Writable text stream (default: standard output)
+
+        Returns:
+            Number of characters rendered
+        """
+        lines = [properties.render(position) for properties, position in self.query(rect)]
+        if lines:
+            lines.append("")
+            (fp or sys.stdout).write("\n".join(lines))
+        return max(len(lines) - 1, 0)
+
+    def __len__(self) -> int:
+        return len(self._characters)
+
+    def _add_glyphs(
+        self, glyphs: Iterable[Tuple[CharacterProperties, Tuple[int, int]]]
+    ) -> None:
+        """Store many glyphs, keeping the spatial index in sync."""
+        if self._spatial_index is not None:
+            glyphs = self._spatial_index.track(glyphs, len(self))
+        self._extend(glyphs)
+
+    def _glyph(self, index: int) -> Tuple[CharacterProperties, Tuple[int, int]]:
+        """Get the (flyweight, position) pair at a document index (storage primitive)."""
+        character = self._characters[index]
+        return character.properties, character.position
+
+    def _columns(
+        self,
+    ) -> Tuple[List[CharacterProperties], "array[int]", "array[int]", "array[int]"]:
+        """Get the flyweight table and per-glyph x, y and index columns (storage primitive)."""
+        flyweight_ids: Dict[CharacterProperties, int] = {}
+        flyweights: List[CharacterProperties] = []
+        xs, ys, indices = array("i"), array("i"), array("I")
+        for properties, (x, y) in self._iter_glyphs():
+            index = flyweight_ids.get(properties)
+            if index is None:
+                index = flyweight_ids[properties] = len(flyweights)
+                flyweights.append(properties)
+            xs.append(x)
+            ys.append(y)
+            indices.append(index)
+        return flyweights, xs, ys, indices
+
+    def save(self, path: str) -> None:
+        """
+        Write the document in the compact binary format read by MappedDocument.
+
+        The flyweight table (char, font, size, color) is stored once, followed
+        by packed x, y and flyweight-index columns.
+
+        Args:
+            path: Destination file path
+        """
+        flyweights, xs, ys, indices = self._columns()
+        typecode = "H" if len(flyweights) <= 0x10000 else "I"
+        if indices.typecode != typecode:
+            indices = array(typecode, indices)
+
+        with open(path, "wb") as fp:
+            fp.write(
+                _FILE_HEADER.pack(
+                    _FILE_MAGIC, _FILE_VERSION, indices.itemsize, len(xs), len(flyweights)
+                )
+            )
+            for properties in flyweights:
+                char, font, size, color = properties.key
+                for text in (char, font):
+                    data = text.encode("utf-8")
+                    fp.write(_FILE_STRING.pack(len(data)) + data)
+                fp.write(_FILE_SIZE.pack(size))
+                data = color.encode("utf-8")
+                fp.write(_FILE_STRING.pack(len(data)) + data)
+
+            fp.write(b"\0" * (-fp.tell() % 4))
+            for column in (xs, ys, indices):
+                if sys.byteorder == "big":
+                    column = array(column.typecode, column)
+                    column.byteswap()
+                fp.write(column.tobytes())
+
+    def _append(self, properties: CharacterProperties, position: Tuple[int, int]) -> None:
+        """Store one glyph (storage primitive overridden by compact documents)."""
+        self._characters.append(Character.from_flyweight(properties, position))
+
+    def _extend(
+        self, glyphs: Iterable[Tuple[CharacterProperties, Tuple[int, int]]]
+    ) -> None:
+        """Store many glyphs at once (storage primitive)."""
+        from_flyweight = Character.from_flyweight
+        self._characters.extend(
+            from_flyweight(properties, position) for properties, position in glyphs
+        )
+
+    def _iter_glyphs(self) -> Iterator[Tuple[CharacterProperties, Tuple[int, int]]]:
+        """Yield (flyweight, position) pairs in document order."""
+        for character in self._characters:
+            yield character.properties, character.position
+
+    def iter_render(self, start: int = 0, stop: Optional[int] = None) -> Iterator[str]:
+        """
+        Lazily yield the rendered line of each character in document order.
+
+        Args:
+            start: Index of the first glyph to render
+            stop: Index after the last glyph to render (default: end of document)
+        """
+        if start == 0 and stop is None:
+            glyphs = self._iter_glyphs()
+        else:
+            glyphs = map(self._glyph, range(*slice(start, stop).indices(len(self))))
+        for properties, position in glyphs:
+            yield properties.render(position)
+
+    def render_to(self, fp: TextIO, chunk_size: int = 8192) -> int:
+        """
+        Write the rendered document to a text stream in large chunks.
+
+        Args:
+            fp: Writable text stream
+            chunk_size: Number of lines joined into a single write
+
+        Returns:
+            Number of characters rendered
+
+        Raises:
+            ValueError: If chunk_size is not positive
+        """
+        if chunk_size <= 0:
+            raise ValueError("Chunk size must be positive")
+
+        lines = self.iter_render()
+        written = 0
+        while True:
+            chunk = list(islice(lines, chunk_size))
+            if not chunk:
+                break
+            chunk.append("")
+            fp.write("\n".join(chunk))
+            written += len(chunk) - 1
+        return written
+
+    def render_parallel(
+        self,
+        fp: TextIO,
+        workers: Optional[int] = None,
+        shard_size: int = 100_000,
+    ) -> int:
+        """
+        Render the document in a process pool and write it in document order.
+
+        The position and flyweight-index columns are copied once into a shared
+        memory block. Each worker attaches to it and renders contiguous shards
+        of glyphs. Workers rebuild the flyweights from their keys, so only the
+        small flyweight table is pickled.
+
+        Args:
+            fp: Writable text stream
+            workers: Number of worker processes (default: CPU count)
+            shard_size: Number of glyphs rendered per task
+
+        Returns:
+            Number of characters rendered
+
+        Raises:
+            ValueError: If workers or shard_size is not positive
+        """
+        if workers is not None and workers <= 0:
+            raise ValueError("Worker count must be positive")
+        if shard_size <= 0:
+            raise ValueError("Shard size must be positive")
+
+        flyweights, xs, ys, indices = self._columns()
+        count = len(xs)
+        if count == 0:
+            return 0
+
+        block = shared_memory.SharedMemory(
+            create=True, size=count * (8 + indices.itemsize)
+        )
+        try:
+            buffer = block.buf
+            buffer[: 4 * count] = memoryview(xs).cast("B")
+            buffer[4 * count : 8 * count] = memoryview(ys).cast("B")
+            # The block may be rounded up to a page, so bound every slice
+            buffer[8 * count : 8 * count + count * indices.itemsize] = memoryview(
+                indices
+            ).cast("B")
+            del buffer
+
+            shards = [
+                (start, min(start + shard_size, count))
+                for start in range(0, count, shard_size)
+            ]
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_render_worker,
+                initargs=(
+                    block.name,
+                    count,
+                    indices.typecode,
+                    [properties.key for properties in flyweights],
+                ),
+            ) as executor:
+                for chunk in executor.map(_render_shard, shards):
+                    fp.write(chunk)
+        finally:
+            block.close()
+            block.unlink()
+        return count
 
     def render(self) -> None:
         """Render all characters in the document."""
         print("\n=== Document Rendering ===")
-        for char in self._characters:
-            print(char.render())
+        self.render_to(sys.stdout)
 
-        print(f"\nTotal characters in document: {len(self._characters)}")
+        print(f"\nTotal characters in document: {len(self)}")
         print(f"Total flyweights created: {CharacterFactory.total_flyweights()}")
+        stats = CharacterFactory.stats()
         print(
-            f"Memory savings: {len(self._characters) - CharacterFactory.total_flyweights()} flyweights saved"
+            f"Flyweight pool: {stats['hits']} hits, {stats['misses']} misses, "
+            f"{stats['evictions']} evictions"
+        )
+
+    def memory_report(self) -> Dict[str, float]:
+        """
+        Measure the bytes held by this document with a sys.getsizeof walk.
+
+        The walk visits every glyph and is far slower than rendering, so it is
+        only run on request rather than as part of render().
+
+        The unshared baseline is the same document with every glyph owning a
+        private copy of its intrinsic state instead of referencing a flyweight.
+
+        Returns:
+            Dictionary with glyph/flyweight counts, storage, flyweight, total
+            and unshared baseline bytes, savings and bytes per glyph
+        """
+        usage: Dict[int, int] = {}
+        flyweights: Dict[int, CharacterProperties] = {}
+        for properties, _ in self._iter_glyphs():
+            key = id(properties)
+            if key in usage:
+                usage[key] += 1
+            else:
+                usage[key] = 1
+                flyweights[key] = properties
+
+        storage_bytes = deep_getsizeof(self, set(flyweights))
+        flyweight_sizes = {
+            key: deep_getsizeof(properties) for key, properties in flyweights.items()
+        }
+        flyweight_bytes = sum(flyweight_sizes.values())
+        unshared_bytes = storage_bytes + sum(
+            flyweight_sizes[key] * count for key, count in usage.items()
         )
+        total_bytes = storage_bytes + flyweight_bytes
+
+        return {
+            "glyphs": len(self),
+            "flyweights": len(flyweights),
+            "storage_bytes": storage_bytes,
+            "flyweight_bytes": flyweight_bytes,
+            "total_bytes": total_bytes,
+            "unshared_bytes": unshared_bytes,
+            "saved_bytes": unshared_bytes - total_bytes,
+            "bytes_per_glyph": total_bytes / len(self) if len(self) else 0.0,
+        }
+
+
+class CompactDocument(Document):
+    """
+    Document that stores glyphs column-wise instead of as Character objects.
+
+    Positions live in parallel signed-int arrays and each glyph refers to its
+    flyweight by a small integer index into a per-document side table, which
+    keeps the per-glyph cost at about ten bytes.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._xs = array("i")
+        self._ys = array("i")
+        self._indices = array("H")
+        self._flyweights: List[CharacterProperties] = []
+        self._flyweight_ids: Dict[CharacterProperties, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._indices)
+
+    def _flyweight_index(self, properties: CharacterProperties) -> int:
+        """Get the side-table index of a flyweight, registering it if new."""
+        index = self._flyweight_ids.get(properties)
+        if index is None:
+            index = len(self._flyweights)
+            if index > 0xFFFF and self._indices.typecode == "H":
+                self._indices = array("I", self._indices)
+            self._flyweights.append(properties)
+            self._flyweight_ids[properties] = index
+        return index
+
+    def _append(self, properties: CharacterProperties, position: Tuple[int, int]) -> None:
+        x, y = position
+        self._xs.append(x)
+        self._ys.append(y)
+        self._indices.append(self._flyweight_index(properties))
+
+    def _extend(
+        self, glyphs: Iterable[Tuple[CharacterProperties, Tuple[int, int]]]
+    ) -> None:
+        append_x, append_y = self._xs.append, self._ys.append
+        append_index = self._indices.append
+        flyweight_index = self._flyweight_index
+        last_properties: Optional[CharacterProperties] = None
+        last_index = 0
+        for properties, (x, y) in glyphs:
+            if properties is not last_properties:
+                last_properties = properties
+                last_index = flyweight_index(properties)
+                append_index = self._indices.append  # May have been widened
+            append_x(x)
+            append_y(y)
+            append_index(last_index)
+
+    def _glyph(self, index: int) -> Tuple[CharacterProperties, Tuple[int, int]]:
+        return self._flyweights[self._indices[index]], (self._xs[index], self._ys[index])
+
+    def _columns(
+        self,
+    ) -> Tuple[List[CharacterProperties], "array[int]", "array[int]", "array[int]"]:
+        return self._flyweights, self._xs, self._ys, self._indices
+
+    def _iter_glyphs(self) -> Iterator[Tuple[CharacterProperties, Tuple[int, int]]]:
+        flyweights = self._flyweights
+        for index, x, y in zip(self._indices, self._xs, self._ys):
+            yield flyweights[index], (x, y)
+
+
+class RunLengthDocument(Document):
+    """
+    Document that run-length encodes style and layout instead of glyphs.
+
+    Consecutive glyphs with the same (font, size, color) on one line and a
+    constant advance form a run, which is exactly what add_text() produces
+    for each line of text. A run stores its first glyph index, style, origin
+    and advance, so positions are not stored per glyph at all; each glyph
+    only keeps its character as a 2-byte code point (widened to 4 bytes for
+    characters outside the BMP). Glyphs placed arbitrarily are still
+    supported, but every break in the layout starts a new run.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._chars = array("H")
+        self._run_starts = array("I")
+        self._run_styles = array("H")
+        self._run_xs = array("i")
+        self._run_ys = array("i")
+        self._run_advances = array("i")
+        self._styles: List[TextStyle] = []
+        self._style_ids: Dict[TextStyle, int] = {}
+        self._flyweights: List[CharacterProperties] = []
+        self._glyph_flyweights: Dict[Tuple[int, int], int] = {}
+
+    def __len__(self) -> int:
+        return len(self._chars)
+
+    def runs(self) -> Iterator[Tuple[int, int, TextStyle]]:
+        """
+        Iterate over the runs of the document.
+
+        Yields:
+            (start index, length, style) for each run in document order
+        """
+        starts = self._run_starts
+        ends = list(starts[1:])
+        ends.append(len(self))
+        for start, end, style in zip(starts, ends, self._run_styles):
+            yield start, end - start, self._styles[style]
+
+    def _register(self, properties: CharacterProperties) -> Tuple[int, int]:
+        """Get the (code point, style index) of a flyweight, registering it if new."""
+        char, font, size, color = properties.key
+        code = ord(char)
+        if code > 0xFFFF and self._chars.typecode == "H":
+            self._chars = array("I", self._chars)
+
+        style = TextStyle(font, size, color)
+        style_index = self._style_ids.get(style)
+        if style_index is None:
+            style_index = len(self._styles)
+            if style_index > 0xFFFF and self._run_styles.typecode == "H":
+                self._run_styles = array("I", self._run_styles)
+            self._styles.append(style)
+            self._style_ids[style] = style_index
+
+        if (code, style_index) not in self._glyph_flyweights:
+            self._glyph_flyweights[code, style_index] = len(self._flyweights)
+            self._flyweights.append(properties)
+        return code, style_index
+
+    def _place(self, style_index: int, x: int, y: int) -> None:
+        """Extend the last run with the next glyph, or open a new run."""
+        if self._run_starts and self._run_styles[-1] == style_index:
+            if self._run_ys[-1] == y:
+                length = len(self._chars) - self._run_starts[-1]
+                if length == 1:
+                    # The second glyph fixes the run's advance
+                    self._run_advances[-1] = x - self._run_xs[-1]
+                    return
+                if x == self._run_xs[-1] + length * self._run_advances[-1]:
+                    return
+        self._run_starts.append(len(self._chars))
+        self._run_styles.append(style_index)
+        self._run_xs.append(x)
+        self._run_ys.append(y)
+        self._run_advances.append(0)
+
+    def _append(self, properties: CharacterProperties, position: Tuple[int, int]) -> None:
+        code, style_index = self._register(properties)
+        x, y = position
+        self._place(style_index, x, y)
+        self._chars.append(code)
+
+    def _extend(
+        self, glyphs: Iterable[Tuple[CharacterProperties, Tuple[int, int]]]
+    ) -> None:
+        place = self._place
+        append_char = self._chars.append
+        last_properties: Optional[CharacterProperties] = None
+        code = style_index = 0
+        for properties, (x, y) in glyphs:
+            if properties is not last_properties:
+                last_properties = properties
+                code, style_index = self._register(properties)
+                append_char = self._chars.append  # May have been widened
+            place(style_index, x, y)
+            append_char(code)
+
+    def _glyph(self, index: int) -> Tuple[CharacterProperties, Tuple[int, int]]:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Glyph index out of range")
+        run = bisect_right(self._run_starts, index) - 1
+        offset = index - self._run_starts[run]
+        flyweight = self._glyph_flyweights[self._chars[index], self._run_styles[run]]
+        position = (
+            self._run_xs[run] + offset * self._run_advances[run],
+            self._run_ys[run],
+        )
+        return self._flyweights[flyweight], position
+
+    def _iter_runs(self) -> Iterator[Tuple[int, int, int, int, int, int]]:
+        """Yield (start, end, style index, x, y, advance) for each run."""
+        ends = list(self._run_starts[1:])
+        ends.append(len(self))
+        return zip(
+            self._run_starts,
+            ends,
+            self._run_styles,
+            self._run_xs,
+            self._run_ys,
+            self._run_advances,
+        )
+
+    def _columns(
+        self,
+    ) -> Tuple[List[CharacterProperties], "array[int]", "array[int]", "array[int]"]:
+        lookup, chars = self._glyph_flyweights, self._chars
+        xs, ys, indices = array("i"), array("i"), array("I")
+        for start, end, style, x, y, advance in self._iter_runs():
+            xs.extend(x + offset * advance for offset in range(end - start))
+            ys.extend(array("i", (y,)) * (end - start))
+            indices.extend(lookup[code, style] for code in chars[start:end])
+        return self._flyweights, xs, ys, indices
+
+    def _iter_glyphs(self) -> Iterator[Tuple[CharacterProperties, Tuple[int, int]]]:
+        flyweights, lookup = self._flyweights, self._glyph_flyweights
+        chars = self._chars
+        for start, end, style, x, y, advance in self._iter_runs():
+            for code in chars[start:end]:
+                yield flyweights[lookup[code, style]], (x, y)
+                x += advance
+
+
+class _RenderWorker:
+    """Shared glyph columns and flyweights attached by a render worker process."""
+
+    block: Optional[shared_memory.SharedMemory] = None
+    count: int = 0
+    typecode: str = "I"
+    flyweights: List[CharacterProperties] = []
+
+
+def _init_render_worker(
+    name: str, count: int, typecode: str, keys: List[FlyweightKey]
+) -> None:
+    """Attach a render worker process to the shared glyph columns."""
+    _RenderWorker.block = shared_memory.SharedMemory(name=name)
+    _RenderWorker.count = count
+    _RenderWorker.typecode = typecode
+    _RenderWorker.flyweights = [ConcreteCharacter(*key) for key in keys]
+
+
+def _render_shard(bounds: Tuple[int, int]) -> str:
+    """Render glyphs [start, stop) from the shared columns as one string."""
+    start, stop = bounds
+    count, flyweights = _RenderWorker.count, _RenderWorker.flyweights
+    assert _RenderWorker.block is not None, "Render worker not initialized"
+
+    buffer = _RenderWorker.block.buf
+    typecode = _RenderWorker.typecode
+    end = 8 * count + count * array(typecode).itemsize  # Block may be page-rounded
+    xs = buffer[: 4 * count].cast("i")[start:stop].tolist()
+    ys = buffer[4 * count : 8 * count].cast("i")[start:stop].tolist()
+    indices = buffer[8 * count : end].cast(typecode)[start:stop].tolist()
+    del buffer
+
+    lines = [
+        flyweights[index].render(position)
+        for index, position in zip(indices, zip(xs, ys))
+    ]
+    lines.append("")
+    return "\n".join(lines)
+
+
+class MappedDocument(CompactDocument):
+    """
+    Read-only document backed by a memory-mapped file written by save().
+
+    Only the header and flyweight table are parsed when the file is opened.
+    The position and index columns are zero-copy views into the mapping, so
+    the operating system pages glyph data in as it is accessed. The views
+    stand in for CompactDocument's arrays, whose glyph access it reuses.
+    """
+
+    def __init__(self, path: str):
+        """
+        Map a saved document.
+
+        Args:
+            path: Path of a file written by Document.save()
+
+        Raises:
+            ValueError: If the file is not a valid flyweight document
+        """
+        super().__init__()
+        with open(path, "rb") as fp:
+            try:
+                self._mmap = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError as e:
+                raise ValueError(f"Not a flyweight document: {path}") from e
+        self._view = memoryview(self._mmap)
+        try:
+            self._load_columns(path)
+        except Exception:
+            self.close()
+            raise
+
+    def _load_columns(self, path: str) -> None:
+        """Parse the header and flyweight table and map the glyph columns."""
+        if len(self._mmap) < _FILE_HEADER.size:
+            raise ValueError(f"Not a flyweight document: {path}")
+        magic, version, width, count, flyweight_count = _FILE_HEADER.unpack_from(
+            self._mmap, 0
+        )
+        if magic != _FILE_MAGIC or width not in (2, 4):
+            raise ValueError(f"Not a flyweight document: {path}")
+        if version != _FILE_VERSION:
+            raise ValueError(f"Unsupported document version {version}: {path}")
+
+        try:
+            offset = _FILE_HEADER.size
+            self._flyweights: List[CharacterProperties] = []
+            for _ in range(flyweight_count):
+                char, offset = self._read_string(offset)
+                font, offset = self._read_string(offset)
+                (size,) = _FILE_SIZE.unpack_from(self._mmap, offset)
+                color, offset = self._read_string(offset + _FILE_SIZE.size)
+                self._flyweights.append(
+                    CharacterFactory.get_character(char, font, size, color)
+                )
+        except struct.error as e:
+            raise ValueError(f"Truncated flyweight document: {path}") from e
+
+        offset += -offset % 4
+        typecode = "H" if width == 2 else "I"
+        if offset + count * (8 + width) > len(self._mmap):
+            raise ValueError(f"Truncated flyweight document: {path}")
+
+        columns = []
+        for column_typecode, itemsize in (("i", 4), ("i", 4), (typecode, width)):
+            column = self._view[offset : offset + count * itemsize].cast(column_typecode)
+            if sys.byteorder == "big":
+                column = array(column_typecode, column)
+                column.byteswap()
+            columns.append(column)
+            offset += count * itemsize
+        self._xs, self._ys, self._indices = columns
+
+    def _read_string(self, offset: int) -> Tuple[str, int]:
+        """Read a length-prefixed UTF-8 string and return it with the next offset."""
+        (length,) = _FILE_STRING.unpack_from(self._mmap, offset)
+        offset += _FILE_STRING.size
+        data = self._mmap[offset : offset + length]
+        if len(data) != length:
+            raise struct.error("string runs past end of file")
+        return data.decode("utf-8"), offset + length
+
+    def close(self) -> None:
+        """Release the column views and unmap the file."""
+        for name in ("_xs", "_ys", "_indices", "_view"):
+            column = self.__dict__.pop(name, None)
+            if isinstance(column, memoryview):
+                column.release()
+        self._mmap.close()
+
+    def __enter__(self) -> "MappedDocument":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _append(self, properties: CharacterProperties, position: Tuple[int, int]) -> None:
+        raise TypeError("Mapped documents are read-only")
+
+    def _extend(
+        self, glyphs: Iterable[Tuple[CharacterProperties, Tuple[int, int]]]
+    ) -> None:
+        raise TypeError("Mapped documents are read-only")
+
+    def _columns(
+        self,
+    ) -> Tuple[List[CharacterProperties], "array[int]", "array[int]", "array[int]"]:
+        columns = []
+        for column in (self._xs, self._ys, self._indices):
+            if isinstance(column, memoryview):
+                # Callers expect arrays (typecode, itemsize); copy in one block
+                copy = array(column.format)
+                copy.frombytes(column.cast("B"))
+                column = copy
+            columns.append(column)
+        xs, ys, indices = columns
+        return self._flyweights, xs, ys, indices
+
+
+def _print_memory_report(document: Document) -> None:
+    """Print the memory_report() summary of a document."""
+    report = document.memory_report()
+    print(
+        f"Memory: {report['total_bytes']:,} bytes "
+        f"({report['bytes_per_glyph']:.1f} per glyph), "
+        f"{report['saved_bytes']:,} bytes saved vs unshared characters"
+    )
 
 
 def demonstrate_flyweight():
@@ -205,6 +1409,43 @@ def demonstrate_flyweight():
 
         # Render the document
         doc.render()
+        _print_memory_report(doc)
+
+        print("\n=== Compact Document ===")
+        compact = CompactDocument()
+        compact.add_text("Flyweight\nPattern", origin=(0, 0), style=TextStyle(size=10))
+        compact.add_characters(
+            (char, (i * 10, 40), TextStyle(color="red")) for i, char in enumerate("Bulk")
+        )
+        compact.render()
+        _print_memory_report(compact)
+
+        print("\n=== Viewport Query ===")
+        compact.enable_spatial_index(cell_size=32)
+        compact.add_text("Indexed", origin=(0, 100))
+        compact.render_viewport((0, 90, 40, 120))
+
+        print("\n=== Run-Length Document ===")
+        runs = RunLengthDocument()
+        runs.add_text(
+            "Each laid-out line\nis stored as one run", style=TextStyle(color="blue")
+        )
+        runs.add_text("without per-glyph positions", origin=(0, 40))
+        print(f"{len(runs)} glyphs stored in {len(list(runs.runs()))} runs")
+        print(f"Bytes per glyph: {runs.memory_report()['bytes_per_glyph']:.1f}")
+
+        print("\n=== Saved And Memory-Mapped Document ===")
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "document.fly")
+            compact.save(path)
+            print(f"Saved {len(compact)} glyphs in {os.path.getsize(path)} bytes")
+            with MappedDocument(path) as mapped:
+                for line in mapped.iter_render(0, 3):
+                    print(line)
+
+        print("\n=== Parallel Rendering ===")
+        rendered = compact.render_parallel(sys.stdout, workers=2, shard_size=8)
+        print(f"Rendered {rendered} characters in shards of 8")
 
         print("\n=== Testing Error Cases ===")
         try:
@@ -222,6 +1463,13 @@ def demonstrate_flyweight():
         except ValueError as e:
             print(f"Expected error: {e}")
 
+        print("\n=== Bounded Flyweight Pool ===")
+        CharacterFactory.configure(max_size=8)
+        for char in "abcdefghijklmnop":
+            CharacterFactory.get_character(char, "Arial", 12, "black")
+        print(f"Pool stats with max_size=8: {CharacterFactory.stats()}")
+        CharacterFactory.configure()
+
     except Exception as e:
         print(f"An unexpected error occurred: {e}")
 
@@ -1,6 +1,33 @@
+import hashlib
+import math
+import mmap
+import os
+import sqlite3
+import struct
+import tempfile
+import threading
 import time
 from abc import abstractmethod
-from typing import Optional, Protocol, runtime_checkable
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext, suppress
+from itertools import islice
+from typing import (
+    BinaryIO,
+    ContextManager,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Protocol,
+    Tuple,
+    Union,
+    runtime_checkable,
+)
 
 
 @runtime_checkable
@@ -12,6 +39,11 @@ class Image(Protocol):
         """Display the image."""
         ...
 
+    @abstractmethod
+    def load(self) -> None:
+        """Load the image data without displaying it."""
+        ...
+
     @property
     @abstractmethod
     def filename(self) -> str:
@@ -25,15 +57,197 @@ class Image(Protocol):
         ...
 
 
+class LatencyHistogram:
+    """
+    Fixed-memory latency histogram with geometrically growing buckets.
+
+    Bucket bounds grow by `growth` from `lowest` seconds upward, so any
+    reported percentile is within one bucket width (about 10% by default)
+    of the true value.
+    """
+
+    def __init__(
+        self, lowest: float = 1e-6, highest: float = 100.0, growth: float = 1.1
+    ):
+        """
+        Initialize an empty histogram.
+
+        Args:
+            lowest: Upper bound of the first bucket in seconds
+            highest: Largest latency tracked by its own bucket in seconds
+            growth: Ratio between consecutive bucket bounds
+
+        Raises:
+            ValueError: For non-positive bounds or a growth ratio <= 1
+        """
+        if lowest <= 0 or highest <= lowest or growth <= 1:
+            raise ValueError("Invalid histogram bounds")
+        bounds = [lowest]
+        while bounds[-1] < highest:
+            bounds.append(bounds[-1] * growth)
+        self._bounds = bounds
+        self._counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        """Add one observation."""
+        self._counts[bisect_left(self._bounds, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.min = min(self.min, seconds)
+        self.max = max(self.max, seconds)
+
+    def percentile(self, q: float) -> float:
+        """
+        Estimate a percentile from the bucket counts.
+
+        Args:
+            q: Percentile between 0 and 100
+
+        Returns:
+            Upper bound of the bucket holding the percentile, clamped to the
+            observed range (0.0 when empty)
+        """
+        if not self.count:
+            return 0.0
+        rank = max(math.ceil(self.count * q / 100), 1)
+        seen = 0
+        for index, bucket_count in enumerate(self._counts):
+            seen += bucket_count
+            if seen >= rank:
+                bound = self._bounds[index] if index < len(self._bounds) else self.max
+                return min(max(bound, self.min), self.max)
+        return self.max
+
+    def summary(self) -> Dict[str, float]:
+        """Get count, mean, min, max and p50/p95/p99 in seconds."""
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else 0.0,
+            "min": self.min if self.count else 0.0,
+            "max": self.max,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+        }
+
+
+class Instrumentation:
+    """
+    Process-wide timing and counter registry for the proxy subsystem.
+
+    Disabled by default: phase() then returns a shared no-op context and
+    increment() returns immediately, so instrumented code pays only an
+    attribute check. Phases recorded are "proxy_creation",
+    "permission_batch" (one policy round trip per gallery page),
+    "permission_check" (the per-image lookup, usually answered from the
+    decision cache), "load" and "display"; counters cover cache hits,
+    misses and coalesced loads.
+    """
+
+    enabled: bool = False
+    _histograms: Dict[str, LatencyHistogram] = {}
+    _counters: Dict[str, int] = {}
+    _lock = threading.Lock()
+    _disabled_phase = nullcontext()
+
+    @classmethod
+    def enable(cls) -> None:
+        """Start recording timings and counters."""
+        cls.enabled = True
+
+    @classmethod
+    def disable(cls) -> None:
+        """Stop recording; already collected data is kept."""
+        cls.enabled = False
+
+    @classmethod
+    def phase(cls, name: str) -> ContextManager[object]:
+        """
+        Time a block of code as one observation of a phase.
+
+        Args:
+            name: Phase name
+
+        Returns:
+            Context manager recording the block's duration when enabled
+        """
+        if not cls.enabled:
+            return cls._disabled_phase
+        return cls._timed(name)
+
+    @classmethod
+    @contextmanager
+    def _timed(cls, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            cls.record(name, time.perf_counter() - start)
+
+    @classmethod
+    def record(cls, name: str, seconds: float) -> None:
+        """Add one timing observation to a phase histogram."""
+        with cls._lock:
+            histogram = cls._histograms.get(name)
+            if histogram is None:
+                histogram = cls._histograms[name] = LatencyHistogram()
+            histogram.record(seconds)
+
+    @classmethod
+    def increment(cls, name: str, amount: int = 1) -> None:
+        """Increase a counter when instrumentation is enabled."""
+        if not cls.enabled:
+            return
+        with cls._lock:
+            cls._counters[name] = cls._counters.get(name, 0) + amount
+
+    @classmethod
+    def snapshot(cls) -> Dict[str, Dict[str, object]]:
+        """
+        Export the collected data for a metrics pipeline.
+
+        Returns:
+            Dictionary with a "phases" mapping of phase name to its latency
+            summary (seconds) and a "counters" mapping of counter values
+        """
+        with cls._lock:
+            return {
+                "phases": {
+                    name: histogram.summary()
+                    for name, histogram in cls._histograms.items()
+                },
+                "counters": dict(cls._counters),
+            }
+
+    @classmethod
+    def reset(cls) -> None:
+        """Discard all collected timings and counters."""
+        with cls._lock:
+            cls._histograms.clear()
+            cls._counters.clear()
+
+
 class RealImage(Image):
-    """Real image class that loads the actual image file."""
+    """
+    Real image class that loads the actual image file.
+
+    Files on disk are memory-mapped and exposed as a read-only memoryview,
+    so slicing the data never copies it. Filenames that do not exist on
+    disk are simulated with a slow fake load, as in the original example.
+    """
 
-    def __init__(self, filename: str):
+    def __init__(self, filename: str, source: Optional[str] = None):
         """
         Initialize with image filename.
 
         Args:
             filename: Path to the image file
+            source: Local copy to read the bytes from instead (default: filename);
+                loading raises FileNotFoundError if the copy has disappeared
 
         Raises:
             ValueError: If filename is empty
@@ -41,8 +255,11 @@ class RealImage(Image):
         if not filename.strip():
             raise ValueError("Filename cannot be empty")
         self._filename = filename
+        self._source = source or filename
         self._size: Optional[int] = None
         self._loaded = False
+        self._mapping: Optional[mmap.mmap] = None
+        self._data: Optional[memoryview] = None
 
     @property
     def filename(self) -> str:
@@ -55,84 +272,1014 @@ class RealImage(Image):
             self._load_image()
         return self._size or 0
 
+    @property
+    def data(self) -> memoryview:
+        """
+        Get the image bytes as a zero-copy view (loads file if needed).
+
+        Slices taken from the view must be released before unload(), e.g. by
+        using them as context managers.
+        """
+        self.load()
+        if self._data is None:
+            return memoryview(b"")
+        return self._data
+
     def _load_image(self) -> None:
-        """Simulate loading image from disk."""
+        """Map the image file into memory, or simulate loading a missing file."""
         print(f"Loading image '{self._filename}' from disk...")
-        time.sleep(2)  # Simulate slow loading
-        # In a real app, we'd actually read the file and get its size
-        self._size = len(self._filename) * 1000  # Simulated size
+        try:
+            fp = open(self._source, "rb")
+        except FileNotFoundError:
+            if self._source != self._filename:
+                raise  # A missing local copy says nothing about the origin
+            time.sleep(2)  # Simulate slow loading
+            self._size = len(self._filename) * 1000  # Simulated size
+        else:
+            with fp:
+                self._size = os.fstat(fp.fileno()).st_size
+                if self._size:
+                    # The mapping stays valid after the file object is closed
+                    self._mapping = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+                    self._data = memoryview(self._mapping)
         self._loaded = True
         print(f"Finished loading image '{self._filename}'")
 
-    def display(self) -> None:
-        """Display the image (loads it first if needed)."""
+    def load(self) -> None:
+        """Load the image from disk if it is not loaded yet."""
         if not self._loaded:
             self._load_image()
+
+    def unload(self) -> None:
+        """
+        Release the image data and unmap the file.
+
+        Raises:
+            BufferError: If slices of the data are still in use
+        """
+        if self._mapping is not None:
+            if self._data is not None:
+                self._data.release()
+            try:
+                self._mapping.close()
+            except BufferError:
+                self._data = memoryview(self._mapping)  # Stay loaded and usable
+                raise
+            self._mapping = None
+        self._data = None
+        self._loaded = False
+
+    def display(self) -> None:
+        """Display the image (loads it first if needed)."""
+        self.load()
         print(f"Displaying image '{self._filename}' ({self.size} bytes)")
 
 
+class DiskImageCache:
+    """
+    Persistent second-level cache of image bytes in a local directory.
+
+    Entries are keyed by the origin's path, mtime and size, so a changed
+    origin file never serves a stale copy. Copies are written to a temporary
+    file and atomically renamed into place. Each hit refreshes the entry's
+    mtime, and the least recently used entries are deleted once the
+    directory holds more than `max_bytes`.
+    """
+
+    _SUFFIX = ".img"
+    _TEMP_PREFIX = ".tmp-"
+
+    def __init__(self, directory: str, max_bytes: int = 1024 * 1024 * 1024):
+        """
+        Open (or create) the cache directory.
+
+        Args:
+            directory: Local directory holding the cached copies
+            max_bytes: Maximum total size of the cached copies in bytes
+
+        Raises:
+            ValueError: If max_bytes is not positive
+        """
+        if max_bytes <= 0:
+            raise ValueError("Cache budget must be positive")
+        os.makedirs(directory, exist_ok=True)
+        self._directory = directory
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._hits = self._misses = self._writes = self._evictions = 0
+
+        self._bytes = 0
+        for entry in os.scandir(directory):
+            if entry.name.startswith(self._TEMP_PREFIX):
+                os.unlink(entry.path)  # Left behind by an interrupted write
+            elif entry.name.endswith(self._SUFFIX):
+                self._bytes += entry.stat().st_size
+
+    def _path(self, filename: str) -> Optional[str]:
+        """Get the cache path for the origin's current version, if it exists."""
+        try:
+            stat = os.stat(filename)
+        except OSError:
+            return None
+        key = f"{os.path.abspath(filename)}\0{stat.st_mtime_ns}\0{stat.st_size}"
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return os.path.join(self._directory, digest + self._SUFFIX)
+
+    def get(self, filename: str) -> Optional[str]:
+        """
+        Find the cached copy of an origin file.
+
+        Args:
+            filename: Path to the origin image file
+
+        Returns:
+            Path of the local copy, or None on a miss
+        """
+        path = self._path(filename)
+        if path is not None:
+            try:
+                os.utime(path)  # Mark as recently used
+            except FileNotFoundError:
+                pass
+            else:
+                with self._lock:
+                    self._hits += 1
+                return path
+        with self._lock:
+            self._misses += 1
+        return None
+
+    def put(self, filename: str, data: memoryview) -> None:
+        """
+        Store a copy of an origin file's bytes.
+
+        Args:
+            filename: Path to the origin image file
+            data: The bytes loaded from the origin
+
+        Raises:
+            OSError: If the copy could not be written
+        """
+        path = self._path(filename)
+        if path is None or data.nbytes > self._max_bytes:
+            return
+
+        fd, temp_path = tempfile.mkstemp(prefix=self._TEMP_PREFIX, dir=self._directory)
+        try:
+            with os.fdopen(fd, "wb") as fp:
+                fp.write(data)
+            os.replace(temp_path, path)
+        except BaseException:
+            with suppress(FileNotFoundError):  # Already removed by a cleanup
+                os.unlink(temp_path)
+            raise
+
+        with self._lock:
+            self._writes += 1
+            self._bytes += data.nbytes
+            over_budget = self._bytes > self._max_bytes
+        if over_budget:
+            self._cleanup()
+
+    def _cleanup(self) -> None:
+        """Delete least recently used copies until the cache fits its budget."""
+        entries = []
+        total = 0
+        for entry in os.scandir(self._directory):
+            if entry.name.endswith(self._SUFFIX):
+                stat = entry.stat()
+                entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+                total += stat.st_size
+        entries.sort()
+
+        evictions = 0
+        for _, size, path in entries:
+            if total <= self._max_bytes:
+                break
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+            evictions += 1
+
+        with self._lock:
+            self._bytes = total
+            self._evictions += evictions
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get the disk cache counters.
+
+        Returns:
+            Dictionary with hits, misses, writes, evictions, cached bytes
+            and the byte budget
+        """
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "writes": self._writes,
+                "evictions": self._evictions,
+                "bytes": self._bytes,
+                "max_bytes": self._max_bytes,
+            }
+
+
+class ImageCache:
+    """
+    Process-wide LRU cache of loaded images shared by all image proxies.
+
+    Images are keyed by filename and charged against a byte budget using
+    their size. When the budget is exceeded the least recently used images
+    are evicted; an image larger than the whole budget is returned without
+    being cached and counted as "oversize" (ImageProxy keeps such images
+    itself so they are still loaded once per proxy).
+
+    Concurrent misses for the same filename are coalesced: the first caller
+    loads the image and the others wait on its in-flight future, receiving
+    the same image or the same exception.
+    """
+
+    DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+    _images: "OrderedDict[str, RealImage]" = OrderedDict()
+    _max_bytes: int = DEFAULT_MAX_BYTES
+    _bytes: int = 0
+    _hits: int = 0
+    _misses: int = 0
+    _evictions: int = 0
+    _coalesced: int = 0
+    _oversize: int = 0
+    _in_flight: Dict[str, "Future[RealImage]"] = {}
+    _disk_cache: Optional[DiskImageCache] = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def configure(
+        cls,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        disk_cache: Optional[DiskImageCache] = None,
+    ) -> None:
+        """
+        Set the byte budget and second-level tier. Clears the cache and
+        resets the counters.
+
+        Args:
+            max_bytes: Maximum total size of cached images in bytes
+            disk_cache: Optional on-disk tier consulted on in-memory misses
+
+        Raises:
+            ValueError: If max_bytes is not positive
+        """
+        if max_bytes <= 0:
+            raise ValueError("Cache budget must be positive")
+        cls.clear()
+        cls._max_bytes = max_bytes
+        cls._disk_cache = disk_cache
+
+    @classmethod
+    def get_image(cls, filename: str) -> RealImage:
+        """
+        Get a loaded image, loading and caching it on a miss.
+
+        Args:
+            filename: Path to the image file
+
+        Returns:
+            The loaded real image
+
+        Raises:
+            ValueError: If filename is empty
+            Exception: Any error raised while loading, also re-raised to
+                callers that were waiting on the same load
+        """
+        with cls._lock:
+            image = cls._images.get(filename)
+            if image is not None:
+                cls._images.move_to_end(filename)
+                cls._hits += 1
+                Instrumentation.increment("cache_hits")
+                return image
+
+            in_flight = cls._in_flight.get(filename)
+            if in_flight is not None:
+                cls._coalesced += 1
+                Instrumentation.increment("cache_coalesced")
+            else:
+                cls._misses += 1
+                Instrumentation.increment("cache_misses")
+                cls._in_flight[filename] = leader = Future()
+
+        if in_flight is not None:
+            # Another caller is already loading this image; share its outcome
+            return in_flight.result()
+
+        try:
+            with Instrumentation.phase("load"):
+                image = cls._load(filename)
+        except BaseException as e:
+            with cls._lock:
+                del cls._in_flight[filename]
+            leader.set_exception(e)
+            raise
+
+        image = cls._insert(filename, image)
+        leader.set_result(image)
+        return image
+
+    @classmethod
+    def _load(cls, filename: str) -> RealImage:
+        """Load an image, preferring a warm copy from the disk tier."""
+        disk_cache = cls._disk_cache
+        if disk_cache is None:
+            image = RealImage(filename)
+            image.load()
+            return image
+
+        local_copy = disk_cache.get(filename)
+        if local_copy is not None:
+            image = RealImage(filename, source=local_copy)
+            try:
+                image.load()
+                return image
+            except FileNotFoundError:
+                pass  # Copy purged after get(); fall back to the origin
+
+        image = RealImage(filename)
+        image.load()
+        if image.data.nbytes:
+            try:
+                disk_cache.put(filename, image.data)
+            except OSError as e:
+                # The second-level copy is best-effort; the image itself loaded
+                print(f"[Cache] Could not store '{filename}' on disk: {e}")
+        return image
+
+    @classmethod
+    def _insert(cls, filename: str, image: RealImage) -> RealImage:
+        """Cache a freshly loaded image, evicting least recently used ones."""
+        size = image.size
+        with cls._lock:
+            cls._in_flight.pop(filename, None)
+            existing = cls._images.get(filename)
+            if existing is not None:
+                return existing
+            if size > cls._max_bytes:
+                cls._oversize += 1
+                return image
+
+            cls._images[filename] = image
+            cls._bytes += size
+            evicted: List[RealImage] = []
+            while cls._bytes > cls._max_bytes:
+                _, oldest = cls._images.popitem(last=False)
+                cls._bytes -= oldest.size
+                cls._evictions += 1
+                evicted.append(oldest)
+
+        for oldest in evicted:
+            try:
+                oldest.unload()
+            except BufferError:
+                pass  # Still sliced by a consumer; freed once it lets go
+        return image
+
+    @classmethod
+    def peek(cls, filename: str) -> Optional[RealImage]:
+        """Get a cached image without loading it or touching the LRU order."""
+        return cls._images.get(filename)
+
+    @classmethod
+    def stats(cls) -> Dict[str, int]:
+        """
+        Get the cache counters.
+
+        Returns:
+            Dictionary with hits, misses, coalesced waits, evictions, loads
+            refused as larger than the budget, cached entries, cached bytes
+            and the byte budget
+        """
+        with cls._lock:
+            return {
+                "hits": cls._hits,
+                "misses": cls._misses,
+                "coalesced": cls._coalesced,
+                "evictions": cls._evictions,
+                "oversize": cls._oversize,
+                "entries": len(cls._images),
+                "bytes": cls._bytes,
+                "max_bytes": cls._max_bytes,
+            }
+
+    @classmethod
+    def clear(cls) -> None:
+        """Drop every cached image and reset the counters."""
+        with cls._lock:
+            cls._images.clear()
+            cls._bytes = cls._hits = cls._misses = cls._evictions = 0
+            cls._coalesced = cls._oversize = 0
+
+
+@runtime_checkable
+class AccessPolicy(Protocol):
+    """Interface for deciding whether a principal may view an image."""
+
+    @abstractmethod
+    def check(self, principal: str, filename: str) -> bool:
+        """
+        Decide whether a principal may view an image.
+
+        Args:
+            principal: Identity requesting access
+            filename: Path to the image file
+
+        Returns:
+            True if access is granted
+        """
+        ...
+
+    @abstractmethod
+    def check_many(self, principal: str, filenames: Iterable[str]) -> Dict[str, bool]:
+        """
+        Decide access for several images in one round trip.
+
+        Args:
+            principal: Identity requesting access
+            filenames: Paths to the image files
+
+        Returns:
+            Mapping of filename to access decision
+        """
+        ...
+
+
+class SimulatedAccessPolicy(AccessPolicy):
+    """Access policy that simulates a slow remote permission service."""
+
+    def __init__(self, latency: float = 0.5, denied_principals: Iterable[str] = ()):
+        """
+        Initialize the simulated service.
+
+        Args:
+            latency: Seconds spent on each round trip to the service
+            denied_principals: Principals refused access to every image
+        """
+        self._latency = latency
+        self._denied = frozenset(denied_principals)
+
+    def check(self, principal: str, filename: str) -> bool:
+        time.sleep(self._latency)  # Simulate access check
+        return principal not in self._denied
+
+    def check_many(self, principal: str, filenames: Iterable[str]) -> Dict[str, bool]:
+        filenames = list(filenames)
+        time.sleep(self._latency)  # One round trip for the whole batch
+        allowed = principal not in self._denied
+        return {filename: allowed for filename in filenames}
+
+
+class CachedAccessPolicy(AccessPolicy):
+    """
+    Access policy decorator that caches decisions per (principal, filename).
+
+    Both grants and denials are remembered until their TTL expires, so
+    repeated checks cost a dictionary lookup instead of a service call.
+    Decisions are kept in write order, which with a fixed TTL is also
+    expiry order: expired entries are purged from the front on every write
+    and the oldest ones are evicted once max_entries is reached.
+    """
+
+    def __init__(
+        self, policy: AccessPolicy, ttl: float = 60.0, max_entries: int = 4096
+    ):
+        """
+        Wrap an access policy with a decision cache.
+
+        Args:
+            policy: Policy consulted on cache misses
+            ttl: Seconds a decision stays valid
+            max_entries: Maximum number of cached decisions
+
+        Raises:
+            ValueError: If ttl is negative or max_entries is not positive
+        """
+        if ttl < 0:
+            raise ValueError("TTL cannot be negative")
+        if max_entries <= 0:
+            raise ValueError("Maximum entries must be positive")
+        self._policy = policy
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._decisions: "OrderedDict[Tuple[str, str], Tuple[bool, float]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def _cached(self, principal: str, filename: str, now: float) -> Optional[bool]:
+        """Get an unexpired cached decision, if any."""
+        entry = self._decisions.get((principal, filename))
+        if entry is None or entry[1] <= now:
+            return None
+        return entry[0]
+
+    def check(self, principal: str, filename: str) -> bool:
+        decision = self._cached(principal, filename, time.monotonic())
+        if decision is None:
+            decision = self._policy.check(principal, filename)
+            with self._lock:
+                self._remember(principal, filename, decision, time.monotonic())
+        return decision
+
+    def check_many(self, principal: str, filenames: Iterable[str]) -> Dict[str, bool]:
+        now = time.monotonic()
+        decisions: Dict[str, bool] = {}
+        missing: List[str] = []
+        for filename in filenames:
+            decision = self._cached(principal, filename, now)
+            if decision is None:
+                missing.append(filename)
+            else:
+                decisions[filename] = decision
+
+        if missing:
+            fetched = self._policy.check_many(principal, missing)
+            now = time.monotonic()
+            with self._lock:
+                for filename, decision in fetched.items():
+                    self._remember(principal, filename, decision, now)
+            decisions.update(fetched)
+        return decisions
+
+    def _remember(
+        self, principal: str, filename: str, decision: bool, now: float
+    ) -> None:
+        """Store a decision, purging expired and excess entries (lock held)."""
+        decisions = self._decisions
+        key = (principal, filename)
+        decisions.pop(key, None)
+        while decisions:
+            oldest = next(iter(decisions.values()))
+            if oldest[1] > now and len(decisions) < self._max_entries:
+                break
+            decisions.popitem(last=False)
+        decisions[key] = (decision, now + self._ttl)
+
+    def invalidate(self, principal: Optional[str] = None) -> None:
+        """
+        Forget cached decisions.
+
+        Args:
+            principal: Only forget this principal's decisions (default: all)
+        """
+        with self._lock:
+            if principal is None:
+                self._decisions.clear()
+            else:
+                for key in [key for key in self._decisions if key[0] == principal]:
+                    del self._decisions[key]
+
+
+DEFAULT_ACCESS_POLICY: AccessPolicy = CachedAccessPolicy(SimulatedAccessPolicy())
+
+
+class ImageMetadata(NamedTuple):
+    """Metadata recorded for an image file without loading it."""
+
+    size: int
+    width: Optional[int]
+    height: Optional[int]
+    mtime_ns: int
+
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+_JPEG_MAX_SEGMENTS = 256
+
+
+def _jpeg_dimensions(fp: BinaryIO) -> Optional[Tuple[int, int]]:
+    """Walk JPEG segment headers to the SOF marker, seeking over segment bodies."""
+    fp.seek(2)
+    for _ in range(_JPEG_MAX_SEGMENTS):
+        marker = fp.read(2)
+        if len(marker) < 2 or marker[0] != 0xFF:
+            return None
+        code = marker[1]
+        while code == 0xFF:  # Fill bytes before the marker code
+            next_byte = fp.read(1)
+            if not next_byte:
+                return None
+            code = next_byte[0]
+        if code == 0x01 or 0xD0 <= code <= 0xD7:
+            continue  # Standalone markers carry no length
+        length_bytes = fp.read(2)
+        if len(length_bytes) < 2:
+            return None
+        (length,) = struct.unpack(">H", length_bytes)
+        if code in _JPEG_SOF_MARKERS:
+            frame = fp.read(5)
+            if len(frame) < 5:
+                return None
+            height, width = struct.unpack(">xHH", frame)
+            return width, height
+        if code == 0xDA:
+            return None  # Start of scan reached without a frame header
+        fp.seek(length - 2, os.SEEK_CUR)
+    return None
+
+
+def read_image_metadata(path: str) -> Optional[ImageMetadata]:
+    """
+    Read an image's byte size and dimensions from its header only.
+
+    PNG (IHDR), GIF (logical screen) and JPEG (SOF) headers are parsed from
+    the first bytes of the file; JPEG segments before the frame header are
+    skipped with seeks instead of reads. Unknown formats report no dimensions.
+
+    Args:
+        path: Path to the image file
+
+    Returns:
+        The file's metadata, or None if it cannot be read
+    """
+    try:
+        with open(path, "rb") as fp:
+            stat = os.fstat(fp.fileno())
+            header = fp.read(32)
+            dimensions: Optional[Tuple[int, int]] = None
+            if header.startswith(_PNG_SIGNATURE) and header[12:16] == b"IHDR":
+                dimensions = struct.unpack(">II", header[16:24])
+            elif header[:6] in (b"GIF87a", b"GIF89a") and len(header) >= 10:
+                dimensions = struct.unpack("<HH", header[6:10])
+            elif header.startswith(b"\xff\xd8"):
+                dimensions = _jpeg_dimensions(fp)
+    except (OSError, struct.error):
+        return None
+
+    width, height = dimensions if dimensions is not None else (None, None)
+    return ImageMetadata(stat.st_size, width, height, stat.st_mtime_ns)
+
+
+class MetadataIndex:
+    """
+    Persistent SQLite sidecar that records image metadata per file.
+
+    Entries are validated against the file's current mtime whenever they are
+    read; a file that changed or disappeared is treated as not indexed and its
+    stale entry is dropped.
+    """
+
+    _BATCH = 500  # Stay below SQLite's bound-parameter limit
+
+    def __init__(self, path: str = ":memory:"):
+        """
+        Open (or create) the sidecar index.
+
+        Args:
+            path: SQLite database file (default: in-memory index)
+        """
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS image_metadata ("
+                "filename TEXT PRIMARY KEY, size INTEGER NOT NULL, "
+                "width INTEGER, height INTEGER, mtime_ns INTEGER NOT NULL)"
+            )
+
+    def rebuild_index(self, paths: Iterable[str]) -> int:
+        """
+        Record metadata for many files in a single transaction.
+
+        Only file headers are read. Files that cannot be opened are skipped.
+
+        Args:
+            paths: Image file paths to index
+
+        Returns:
+            Number of files indexed
+        """
+        rows = []
+        for path in paths:
+            metadata = read_image_metadata(path)
+            if metadata is not None:
+                rows.append((path, *metadata))
+
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO image_metadata VALUES (?, ?, ?, ?, ?)", rows
+            )
+        return len(rows)
+
+    def get(self, filename: str) -> Optional[ImageMetadata]:
+        """
+        Get the metadata of one file if it is indexed and unchanged.
+
+        Args:
+            filename: Path to the image file
+
+        Returns:
+            The recorded metadata, or None when missing or stale
+        """
+        return self.get_many([filename]).get(filename)
+
+    def get_many(self, filenames: Iterable[str]) -> Dict[str, ImageMetadata]:
+        """
+        Get the metadata of many files, skipping missing or stale entries.
+
+        Args:
+            filenames: Paths to the image files
+
+        Returns:
+            Mapping of filename to its recorded metadata
+        """
+        filenames = list(dict.fromkeys(filenames))
+        rows: List[Tuple[str, int, Optional[int], Optional[int], int]] = []
+        with self._lock:
+            for start in range(0, len(filenames), self._BATCH):
+                batch = filenames[start : start + self._BATCH]
+                rows.extend(
+                    self._connection.execute(
+                        "SELECT filename, size, width, height, mtime_ns "
+                        "FROM image_metadata WHERE filename IN "
+                        f"({', '.join('?' * len(batch))})",
+                        batch,
+                    )
+                )
+
+        found: Dict[str, ImageMetadata] = {}
+        stale: List[Tuple[str]] = []
+        for filename, *fields in rows:
+            metadata = ImageMetadata(*fields)
+            try:
+                current = os.stat(filename).st_mtime_ns
+            except OSError:
+                current = None
+            if current == metadata.mtime_ns:
+                found[filename] = metadata
+            else:
+                stale.append((filename,))
+
+        if stale:
+            with self._lock, self._connection:
+                self._connection.executemany(
+                    "DELETE FROM image_metadata WHERE filename = ?", stale
+                )
+        return found
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._connection.close()
+
+
 class ImageProxy(Image):
     """
     Proxy class for images that controls access to the RealImage.
     Implements lazy loading and access control.
     """
 
-    def __init__(self, filename: str):
+    def __init__(
+        self,
+        filename: str,
+        principal: str = "anonymous",
+        policy: Optional[AccessPolicy] = None,
+    ):
         """
         Initialize with image filename.
 
         Args:
             filename: Path to the image file
+            principal: Identity the image is displayed for
+            policy: Access policy to consult (default: shared cached policy)
 
         Raises:
             ValueError: If filename is empty
         """
-        if not filename.strip():
-            raise ValueError("Filename cannot be empty")
-        self._filename = filename
-        self._real_image: Optional[RealImage] = None
+        with Instrumentation.phase("proxy_creation"):
+            if not filename.strip():
+                raise ValueError("Filename cannot be empty")
+            self._filename = filename
+            self._principal = principal
+            self._policy = policy if policy is not None else DEFAULT_ACCESS_POLICY
+            self._metadata: Optional[ImageMetadata] = None
+            self._metadata_read = False
+            # Images too large for the shared cache stay with their proxy
+            self._oversize_image: Optional[RealImage] = None
 
     @property
     def filename(self) -> str:
         return self._filename
 
+    @property
+    def metadata(self) -> Optional[ImageMetadata]:
+        """
+        Get size and dimensions from the file header without a full load.
+
+        The header is read at most once; a missing or unreadable file is
+        remembered as None instead of being retried on every size lookup.
+        """
+        if not self._metadata_read:
+            self._metadata = read_image_metadata(self._filename)
+            self._metadata_read = True
+        return self._metadata
+
     @property
     def size(self) -> int:
-        """Get image size (delegates to real image when needed)."""
-        if self._real_image is None:
+        """Get image size (from the shared cache or the file header)."""
+        real_image = self._oversize_image or ImageCache.peek(self._filename)
+        if real_image is not None:
+            return real_image.size
+        metadata = self.metadata
+        if metadata is None:
             # Simulate getting size from metadata without full load
             return len(self._filename) * 1000  # Same simulated size as RealImage
-        return self._real_image.size
+        return metadata.size
+
+    def load(self) -> None:
+        """Load the real image into the shared cache ahead of display."""
+        self._real_image()
+
+    def _real_image(self) -> RealImage:
+        """
+        Get the real image from the shared cache, loading it if needed.
+
+        An image the cache refused because it exceeds the whole budget is
+        kept on the proxy, so it is still loaded only once per proxy.
+        """
+        if self._oversize_image is not None:
+            return self._oversize_image
+        real_image = ImageCache.get_image(self._filename)
+        if ImageCache.peek(self._filename) is not real_image:
+            self._oversize_image = real_image
+        return real_image
 
     def display(self) -> None:
         """
-        Display the image using lazy loading.
+        Display the image using lazy loading through the shared image cache.
 
         Raises:
             RuntimeError: If image fails to load
         """
         try:
-            if self._real_image is None:
-                print(f"[Proxy] Creating real image for '{self._filename}'")
-                self._real_image = RealImage(self._filename)
-
             print(f"[Proxy] Checking access permissions for '{self._filename}'")
-            time.sleep(0.5)  # Simulate access check
+            with Instrumentation.phase("permission_check"):
+                allowed = self._policy.check(self._principal, self._filename)
+            if not allowed:
+                raise PermissionError(
+                    f"Access denied to '{self._filename}' for '{self._principal}'"
+                )
+
+            if self._oversize_image is None and ImageCache.peek(self._filename) is None:
+                print(f"[Proxy] Creating real image for '{self._filename}'")
+            real_image = self._real_image()
 
             print(f"[Proxy] Forwarding display request for '{self._filename}'")
-            self._real_image.display()
+            with Instrumentation.phase("display"):
+                real_image.display()
         except Exception as e:
             raise RuntimeError(f"Failed to display image: {e}") from e
 
 
+class ReadAheadPrefetcher:
+    """
+    Warms the shared image cache with the images around the one on display.
+
+    Each time the gallery displays an image, the next `ahead` (and previous
+    `behind`) images are loaded in background threads. Prefetches that are
+    no longer near the displayed image are cancelled, and the images queued
+    at once never add up to more than `budget_fraction` of the cache budget,
+    so read-ahead cannot flush the images the user is looking at.
+    """
+
+    def __init__(
+        self,
+        ahead: int = 3,
+        behind: int = 0,
+        workers: int = 2,
+        budget_fraction: float = 0.5,
+    ):
+        """
+        Initialize the prefetcher.
+
+        Args:
+            ahead: Number of following images to warm
+            behind: Number of preceding images to warm
+            workers: Number of background loading threads
+            budget_fraction: Share of the cache budget read-ahead may occupy
+
+        Raises:
+            ValueError: For negative window sizes, no workers or a fraction
+                outside (0, 1]
+        """
+        if ahead < 0 or behind < 0:
+            raise ValueError("Prefetch window cannot be negative")
+        if workers <= 0:
+            raise ValueError("Worker count must be positive")
+        if not 0 < budget_fraction <= 1:
+            raise ValueError("Budget fraction must be in (0, 1]")
+
+        self.ahead = ahead
+        self.behind = behind
+        self._budget_fraction = budget_fraction
+        self._executor = ThreadPoolExecutor(max_workers=workers)
+        self._futures: Dict[str, "Future[RealImage]"] = {}
+        self._counters = {
+            "displays": 0,
+            "hits": 0,
+            "in_flight_hits": 0,
+            "issued": 0,
+            "cancelled": 0,
+            "skipped_budget": 0,
+        }
+
+    def on_display(self, filename: str, neighbours: List[Image]) -> None:
+        """
+        Record a display and re-target read-ahead around it.
+
+        Args:
+            filename: Image about to be displayed
+            neighbours: Nearby images in prefetch priority order; callers pass
+                only images the principal may view, since they are loaded into
+                the shared cache ahead of their own access check
+        """
+        self._counters["displays"] += 1
+        future = self._futures.pop(filename, None)
+        if future is not None:
+            # A queued or running prefetch is left alone: the display joins it
+            # through the cache's in-flight load or finds the image cached
+            if future.running():
+                self._counters["in_flight_hits"] += 1
+            elif future.done() and future.exception() is None:
+                self._counters["hits"] += 1
+
+        targets: Dict[str, Image] = {}
+        for image in neighbours:
+            if isinstance(image, ImageProxy) and image.filename != filename:
+                targets.setdefault(image.filename, image)
+
+        # Drop read-ahead for images the user has navigated away from
+        for stale in [name for name in self._futures if name not in targets]:
+            if self._futures.pop(stale).cancel():
+                self._counters["cancelled"] += 1
+
+        budget = ImageCache.stats()["max_bytes"] * self._budget_fraction
+        for name, image in targets.items():
+            budget -= image.size
+            if budget < 0:
+                self._counters["skipped_budget"] += 1
+                continue
+            if name in self._futures or ImageCache.peek(name) is not None:
+                continue
+            self._futures[name] = self._executor.submit(ImageCache.get_image, name)
+            self._counters["issued"] += 1
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Get the read-ahead counters.
+
+        Returns:
+            Dictionary with displays, hits (already loaded), in-flight hits,
+            issued, cancelled and budget-skipped prefetches, and the hit rate
+        """
+        stats: Dict[str, float] = dict(self._counters)
+        displays = self._counters["displays"]
+        stats["hit_rate"] = self._counters["hits"] / displays if displays else 0.0
+        return stats
+
+    def close(self) -> None:
+        """Cancel pending prefetches and stop the background threads."""
+        self._futures.clear()
+        self._executor.shutdown(cancel_futures=True)
+
+
 class ImageGallery:
     """
     Client class that uses images through the proxy.
     Demonstrates how the proxy pattern can optimize performance.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        principal: str = "anonymous",
+        policy: Optional[AccessPolicy] = None,
+        metadata_index: Optional[MetadataIndex] = None,
+        prefetcher: Optional[ReadAheadPrefetcher] = None,
+    ):
+        """
+        Initialize an empty gallery.
+
+        Args:
+            principal: Identity the gallery is displayed for
+            policy: Access policy shared by the gallery's proxies
+                (default: shared cached policy)
+            metadata_index: Sidecar index consulted by show_image_info
+            prefetcher: Read-ahead prefetcher notified of every display
+        """
         self._images: list[Image] = []
+        self._principal = principal
+        self._policy = policy if policy is not None else DEFAULT_ACCESS_POLICY
+        self._metadata_index = metadata_index
+        self._prefetcher = prefetcher
 
     def add_image(self, filename: str, use_proxy: bool = True) -> None:
         """
@@ -147,7 +1294,9 @@ class ImageGallery:
         """
         try:
             if use_proxy:
-                self._images.append(ImageProxy(filename))
+                self._images.append(
+                    ImageProxy(filename, self._principal, self._policy)
+                )
                 print(f"Added proxy for image '{filename}'")
             else:
                 self._images.append(RealImage(filename))
@@ -156,36 +1305,346 @@ class ImageGallery:
             print(f"Error adding image: {e}")
             raise
 
-    def display_all(self) -> None:
-        """Display all images in the gallery."""
+    def display_all(self, concurrency: int = 0) -> None:
+        """
+        Display all images in the gallery.
+
+        Args:
+            concurrency: Number of upcoming images loaded in background threads
+                while earlier ones are displayed (0 loads each image on display)
+
+        Raises:
+            ValueError: If concurrency is negative
+        """
+        if concurrency < 0:
+            raise ValueError("Concurrency cannot be negative")
+
         print("\nDisplaying gallery contents:")
-        for i, image in enumerate(self._images, 1):
-            print(f"\nImage {i}: {image.filename}")
-            try:
-                start_time = time.time()
-                image.display()
-                elapsed = time.time() - start_time
-                print(f"Display time: {elapsed:.2f} seconds")
-            except RuntimeError as e:
-                print(f"Error displaying image: {e}")
+        for offset, images in self._pages():
+            self._display_images(images, offset, concurrency)
+
+    def display_range(self, start: int, stop: int, concurrency: int = 0) -> None:
+        """
+        Display the images in positions [start, stop) of the gallery.
+
+        Args:
+            start: Zero-based position of the first image
+            stop: Position after the last image
+            concurrency: Number of upcoming images loaded in background threads
+
+        Raises:
+            ValueError: For an invalid range or negative concurrency
+        """
+        if start < 0 or stop < start:
+            raise ValueError("Invalid image range")
+        if concurrency < 0:
+            raise ValueError("Concurrency cannot be negative")
+
+        print(f"\nDisplaying gallery images {start + 1} to {stop}:")
+        self._display_images(self._window(start, stop), start, concurrency)
+
+    def _pages(self) -> Iterator[Tuple[int, List[Image]]]:
+        """Yield (offset, images) pages that together cover the gallery."""
+        yield 0, self._images
+
+    def _window(self, start: int, stop: int) -> List[Image]:
+        """Get the images in positions [start, stop)."""
+        return self._images[start:stop]
+
+    def _display_images(
+        self, images: List[Image], offset: int, concurrency: int
+    ) -> None:
+        """Display a run of images, prefetching upcoming ones when concurrent."""
+        executor = ThreadPoolExecutor(max_workers=concurrency) if concurrency else None
+        prefetches: Dict[int, Future] = {}
+        decisions = self._authorize(images)
+        try:
+            for position, image in enumerate(images):
+                if executor is not None:
+                    # Keep the `concurrency` images after the current one loading
+                    # in the background while this one is displayed
+                    last = min(position + 1 + concurrency, len(images))
+                    for ahead in range(position + 1, last):
+                        upcoming = images[ahead]
+                        if ahead not in prefetches and self._may_load(
+                            upcoming, decisions
+                        ):
+                            prefetches[ahead] = executor.submit(upcoming.load)
+                if self._prefetcher is not None:
+                    self._prefetcher.on_display(
+                        image.filename, self._neighbours(images, position, decisions)
+                    )
+                self._display_image(
+                    offset + position + 1, image, prefetches.pop(position, None)
+                )
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+
+    @staticmethod
+    def _may_load(image: Image, decisions: Dict[str, bool]) -> bool:
+        """
+        Check whether an image may be loaded ahead of its own display.
+
+        Proxies are only prefetched when the batch access check granted
+        them, so a denied image never reaches the shared image cache.
+        """
+        if not isinstance(image, ImageProxy):
+            return True
+        return decisions.get(image.filename, False)
+
+    def _neighbours(
+        self, images: List[Image], position: int, decisions: Dict[str, bool]
+    ) -> List[Image]:
+        """Get the permitted images to read ahead around `position`, nearest first."""
+        assert self._prefetcher is not None
+        following = images[position + 1 : position + 1 + self._prefetcher.ahead]
+        preceding = images[max(position - self._prefetcher.behind, 0) : position]
+        return [
+            image
+            for image in following + preceding[::-1]
+            if self._may_load(image, decisions)
+        ]
+
+    def authorize_all(self) -> Dict[str, bool]:
+        """
+        Check access to every proxied image, one policy round trip per page.
+
+        The decisions are cached by the policy, so the per-image checks made
+        while displaying are answered without another round trip.
+
+        Returns:
+            Mapping of filename to access decision
+        """
+        decisions: Dict[str, bool] = {}
+        for _, images in self._pages():
+            decisions.update(self._authorize(images))
+        return decisions
+
+    def _authorize(self, images: List[Image]) -> Dict[str, bool]:
+        """Check access to the proxied images among `images` in one round trip."""
+        filenames = [
+            image.filename for image in images if isinstance(image, ImageProxy)
+        ]
+        if not filenames:
+            return {}
+        with Instrumentation.phase("permission_batch"):
+            return self._policy.check_many(self._principal, filenames)
+
+    def _display_image(self, i: int, image: Image, prefetch: Optional[Future]) -> None:
+        """Display one image, waiting for its background load first if any."""
+        print(f"\nImage {i}: {image.filename}")
+        try:
+            start_time = time.time()
+            if prefetch is not None:
+                # A failed prefetch is retried by display() so errors surface as usual
+                prefetch.exception()
+            image.display()
+            elapsed = time.time() - start_time
+            print(f"Display time: {elapsed:.2f} seconds")
+        except RuntimeError as e:
+            print(f"Error displaying image: {e}")
 
     def show_image_info(self) -> None:
-        """Show info for all images without loading them."""
+        """
+        Show info for all images without loading them.
+
+        Indexed images are answered from the metadata index in one batch;
+        the rest fall back to the image's own size.
+        """
         print("\nGallery image info (no loading performed):")
-        for i, image in enumerate(self._images, 1):
-            print(f"Image {i}: {image.filename} ({image.size} bytes)")
+        for offset, images in self._pages():
+            self._show_info(images, offset)
+
+    def _show_info(self, images: List[Image], offset: int) -> None:
+        """Print info for a run of images, batching index lookups."""
+        indexed: Dict[str, ImageMetadata] = {}
+        if self._metadata_index is not None:
+            indexed = self._metadata_index.get_many(image.filename for image in images)
+
+        for i, image in enumerate(images, offset + 1):
+            metadata = indexed.get(image.filename)
+            if metadata is None:
+                print(f"Image {i}: {image.filename} ({image.size} bytes)")
+            elif metadata.width is None or metadata.height is None:
+                print(f"Image {i}: {image.filename} ({metadata.size} bytes, indexed)")
+            else:
+                print(
+                    f"Image {i}: {image.filename} ({metadata.size} bytes, "
+                    f"{metadata.width}x{metadata.height}, indexed)"
+                )
+
+
+@runtime_checkable
+class ImageManifest(Protocol):
+    """Interface for sources of gallery filenames read window by window."""
+
+    @abstractmethod
+    def window(self, start: int, stop: int) -> List[str]:
+        """
+        Get the filenames in positions [start, stop).
+
+        Args:
+            start: Zero-based position of the first filename
+            stop: Position after the last filename
+
+        Returns:
+            The non-blank filenames, fewer than requested at the end of the
+            manifest
+        """
+        ...
+
+
+class FileManifest(ImageManifest):
+    """
+    Manifest stored as a text file with one filename per line.
+
+    Lines are read on demand and blank lines are skipped, so positions count
+    filenames only. The byte offset of every `checkpoint_every`-th filename
+    is remembered as the file is scanned, so later windows seek close to
+    their first line instead of rereading the file from the start.
+    """
+
+    def __init__(self, path: str, checkpoint_every: int = 1024):
+        """
+        Initialize the manifest.
+
+        Args:
+            path: Path to the manifest file
+            checkpoint_every: Number of lines between remembered offsets
+
+        Raises:
+            ValueError: If checkpoint_every is not positive
+        """
+        if checkpoint_every <= 0:
+            raise ValueError("Checkpoint interval must be positive")
+        self._path = path
+        self._every = checkpoint_every
+        self._checkpoints = array("Q", [0])
+
+    def window(self, start: int, stop: int) -> List[str]:
+        slot = min(start // self._every, len(self._checkpoints) - 1)
+        line_number = slot * self._every
+        filenames: List[str] = []
+        with open(self._path, "rb") as fp:
+            fp.seek(self._checkpoints[slot])
+            while line_number < stop:
+                offset = fp.tell()
+                line = fp.readline()
+                if not line:
+                    break
+                filename = line.decode("utf-8").rstrip("\r\n")
+                if not filename.strip():
+                    continue  # Blank lines are not entries
+                if line_number == len(self._checkpoints) * self._every:
+                    self._checkpoints.append(offset)
+                if line_number >= start:
+                    filenames.append(filename)
+                line_number += 1
+        return filenames
+
+
+class IteratorManifest(ImageManifest):
+    """Manifest backed by an iterator or generator, readable only forward."""
+
+    def __init__(self, filenames: Iterable[str]):
+        """
+        Initialize the manifest.
+
+        Args:
+            filenames: Iterable producing filenames in gallery order; blank
+                entries are skipped
+        """
+        self._filenames = (filename for filename in filenames if filename.strip())
+        self._position = 0
+
+    def window(self, start: int, stop: int) -> List[str]:
+        if start < self._position:
+            raise ValueError("Iterator manifests can only be read forward")
+        # Skip to the window start without keeping the skipped filenames
+        for _ in islice(self._filenames, start - self._position):
+            pass
+        self._position = start
+        filenames = list(islice(self._filenames, stop - start))
+        self._position += len(filenames)
+        return filenames
+
+
+class VirtualImageGallery(ImageGallery):
+    """
+    Gallery backed by a filename manifest instead of a list of images.
+
+    Proxies are created only for the window being displayed, so memory use
+    depends on the window size rather than the size of the catalogue.
+    """
+
+    def __init__(
+        self,
+        manifest: Union[str, Iterable[str], ImageManifest],
+        page_size: int = 100,
+        principal: str = "anonymous",
+        policy: Optional[AccessPolicy] = None,
+        metadata_index: Optional[MetadataIndex] = None,
+        prefetcher: Optional[ReadAheadPrefetcher] = None,
+    ):
+        """
+        Initialize the gallery over a manifest.
+
+        Args:
+            manifest: Manifest file path, iterable of filenames or manifest object
+            page_size: Number of images materialized at a time when paging
+                through the whole gallery
+            principal: Identity the gallery is displayed for
+            policy: Access policy shared by the gallery's proxies
+            metadata_index: Sidecar index consulted by show_image_info
+            prefetcher: Read-ahead prefetcher notified of every display
+
+        Raises:
+            ValueError: If page_size is not positive
+        """
+        if page_size <= 0:
+            raise ValueError("Page size must be positive")
+        super().__init__(principal, policy, metadata_index, prefetcher)
+        if isinstance(manifest, str):
+            manifest = FileManifest(manifest)
+        elif not isinstance(manifest, ImageManifest):
+            manifest = IteratorManifest(manifest)
+        self._manifest = manifest
+        self._page_size = page_size
+
+    def add_image(self, filename: str, use_proxy: bool = True) -> None:
+        raise TypeError("Manifest-backed galleries are read-only")
+
+    def _window(self, start: int, stop: int) -> List[Image]:
+        return [
+            ImageProxy(filename, self._principal, self._policy)
+            for filename in self._manifest.window(start, stop)
+        ]
+
+    def _pages(self) -> Iterator[Tuple[int, List[Image]]]:
+        offset = 0
+        while True:
+            images = self._window(offset, offset + self._page_size)
+            if not images:
+                return
+            yield offset, images
+            offset += len(images)
 
 
 def demonstrate_proxy():
     """Demonstrate the Proxy pattern with image loading."""
     try:
+        Instrumentation.enable()
         gallery = ImageGallery()
 
         # Add some images (some with proxies, some without)
         gallery.add_image("vacation.jpg")
         gallery.add_image("profile.png", use_proxy=True)
         gallery.add_image("family.jpg", use_proxy=False)
-        gallery.add_image("")
+        try:
+            gallery.add_image("")
+        except ValueError as e:
+            print(f"Expected error: {e}")
 
         # Show info without loading images
         gallery.show_image_info()
@@ -193,6 +1652,84 @@ def demonstrate_proxy():
         # Display all images (will load as needed)
         gallery.display_all()
 
+        # Display again with the next two images loading in the background
+        prefetched = ImageGallery()
+        for filename in ("beach.jpg", "mountains.png", "city.jpg", "forest.png"):
+            prefetched.add_image(filename)
+        prefetched.display_all(concurrency=2)
+
+        # A second proxy for an already displayed image is served from the cache
+        gallery.add_image("vacation.jpg")
+        gallery.display_all()
+        print(f"\nImage cache stats: {ImageCache.stats()}")
+        for name, summary in Instrumentation.snapshot()["phases"].items():
+            print(
+                f"{name}: n={summary['count']} p50={summary['p50'] * 1000:.2f}ms "
+                f"p95={summary['p95'] * 1000:.2f}ms p99={summary['p99'] * 1000:.2f}ms"
+            )
+
+        # Serve image info for files on disk from a sidecar metadata index
+        with tempfile.TemporaryDirectory() as directory:
+            paths = []
+            headers = {
+                "scan.png": _PNG_SIGNATURE
+                + struct.pack(">I4sII", 13, b"IHDR", 640, 480),
+                "poster.gif": b"GIF89a" + struct.pack("<HH", 800, 600),
+                "photo.jpg": b"\xff\xd8\xff\xe0"
+                + struct.pack(">H", 16)
+                + bytes(14)
+                + b"\xff\xc0"
+                + struct.pack(">HBHH", 17, 8, 1080, 1920),
+            }
+            for name, header in headers.items():
+                path = os.path.join(directory, name)
+                with open(path, "wb") as fp:
+                    fp.write(header + bytes(4096))
+                paths.append(path)
+
+            index = MetadataIndex(os.path.join(directory, "metadata.sqlite3"))
+            print(f"\nIndexed {index.rebuild_index(paths)} files")
+            indexed_gallery = ImageGallery(metadata_index=index)
+            for path in paths:
+                indexed_gallery.add_image(path)
+            indexed_gallery.show_image_info()
+            index.close()
+
+            # Real files are memory-mapped and sliced without copying
+            image = RealImage(paths[0])
+            with image.data[:8] as signature:
+                print(f"PNG signature: {signature.tobytes()!r}")
+            image.unload()
+
+            # A restarted service is served from warm local copies
+            disk_cache = DiskImageCache(os.path.join(directory, "image-cache"))
+            for _ in range(2):
+                ImageCache.configure(disk_cache=disk_cache)
+                ImageCache.get_image(paths[1])
+            print(f"Disk cache stats: {disk_cache.stats()}")
+            ImageCache.configure()
+
+            # Page through a large manifest one window at a time
+            manifest_path = os.path.join(directory, "manifest.txt")
+            with open(manifest_path, "w", encoding="utf-8") as fp:
+                for n in range(100_000):
+                    fp.write(f"{directory}/photo_{n:06d}.jpg\n")
+            prefetcher = ReadAheadPrefetcher(ahead=2)
+            catalogue = VirtualImageGallery(manifest_path, prefetcher=prefetcher)
+            catalogue.display_range(50_000, 50_004)
+            print(f"\nRead-ahead stats: {prefetcher.stats()}")
+            prefetcher.close()
+
+        print("\n=== Testing Access Denial ===")
+        restricted = ImageGallery(
+            principal="guest",
+            policy=CachedAccessPolicy(
+                SimulatedAccessPolicy(latency=0.1, denied_principals={"guest"})
+            ),
+        )
+        restricted.add_image("vacation.jpg")
+        restricted.display_all()
+
         print("\n=== Testing Error Cases ===")
         try:
             gallery.add_image("corrupted.jpg")